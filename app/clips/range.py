@@ -2,16 +2,44 @@ from __future__ import annotations
 
 import subprocess
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Sequence, Tuple
 
 from app.runtime_paths import get_app_data_dir
-from app.split_bookmarks import count_events, load_bookmarks, parse_vod_start_time, run_ffmpeg
+from app.split_bookmarks import BookmarkEvent, count_events, load_bookmarks, parse_vod_start_time, run_ffmpeg
 from app.system.path_policy import normalize_allowed_dirs, resolve_allowed_path
 from app.vod.catalog import get_vod_dirs, list_sessions_for_vod
 
 
+def _sort_bookmarks(
+    events: Sequence[BookmarkEvent],
+) -> Tuple[Tuple[float, ...], Tuple[BookmarkEvent, ...]]:
+    ordered = sorted(events, key=lambda event: event.time)
+    return tuple(event.time for event in ordered), tuple(ordered)
+
+
+@lru_cache(maxsize=64)
+def _load_sorted_bookmarks(
+    session_path: str,
+    mtime_ns: int,
+) -> Tuple[Tuple[float, ...], Tuple[BookmarkEvent, ...]]:
+    return _sort_bookmarks(load_bookmarks(Path(session_path)))
+
+
+def _events_in_range(session_path: Path, start: float, end: float) -> Sequence[BookmarkEvent]:
+    # Keyed on mtime so repeated clips from one session reuse the parsed, time-sorted events.
+    try:
+        mtime_ns = session_path.stat().st_mtime_ns
+    except OSError:
+        times, events = _sort_bookmarks(load_bookmarks(session_path))
+    else:
+        times, events = _load_sorted_bookmarks(str(session_path), mtime_ns)
+    return events[bisect_left(times, start) : bisect_right(times, end)]
+
+
 def create_clip_range_payload(
     config: Dict[str, Any],
     vod_path: Any,
@@ -35,7 +63,7 @@ def create_clip_range_payload(
     vod_file = resolve_allowed_path(path_value, allowed_dirs)
     if vod_file is None:
         return {"ok": False, "error": "Invalid VOD path"}, 403
-    if not vod_file.exists() or not vod_file.is_file():
+    if not vod_file.is_file():
         return {"ok": False, "error": "VOD not found"}, 404
 
     extensions = {ext.lower() for ext in config.get("split", {}).get("extensions", [])}
@@ -75,13 +103,12 @@ def create_clip_range_payload(
     if not bookmarks_dir.is_absolute():
         bookmarks_dir = get_app_data_dir() / bookmarks_dir
     session_prefix = config.get("bookmarks", {}).get("session_prefix", "session")
-    sessions = list_sessions_for_vod(bookmarks_dir, session_prefix, vod_file.stem)
+    sessions = list_sessions_for_vod(bookmarks_dir, session_prefix, vod_file.stem, limit=1)
 
     if sessions and split_cfg.get("encode_counts", True):
         session_path = Path(sessions[0]["path"])
         try:
-            all_events = load_bookmarks(session_path)
-            clip_events = [event for event in all_events if start <= event.time <= end]
+            clip_events = _events_in_range(session_path, start, end)
             if clip_events:
                 counts = count_events(clip_events)
                 count_format = split_cfg.get("count_format", "k{kills}_a{assists}_d{deaths}")
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import os
+import re
 import shutil
 import subprocess
 import sys
-from pathlib import Path
+import threading
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.runtime_paths import is_frozen, prepare_torch_runtime
@@ -76,63 +79,123 @@ def ocr_gpu_diagnostics_payload() -> Dict[str, Any]:
     return payload
 
 
-def install_gpu_ocr_dependencies() -> Tuple[Dict[str, Any], int]:
+INSTALL_REQUIRED_FREE_BYTES = 10 * 1024 * 1024 * 1024
+DISK_SPACE_CACHE_TTL_SECONDS = 30.0
+
+_disk_space_lock = threading.Lock()
+_disk_space_cache: Dict[str, Tuple[float, Tuple[bool, str]]] = {}
+
+
+def _install_drive_root(python_exe_path: str) -> str:
+    drive = os.path.splitdrive(python_exe_path)[0]
+    if not drive:
+        drive = os.path.splitdrive(os.path.expanduser("~"))[0]
+    return drive + os.sep
+
+
+def check_install_disk_space(python_exe_path: str) -> Tuple[bool, str]:
+    root = _install_drive_root(python_exe_path)
+    now = time.monotonic()
+    with _disk_space_lock:
+        cached = _disk_space_cache.get(root)
+    if cached is not None and now - cached[0] < DISK_SPACE_CACHE_TTL_SECONDS:
+        return cached[1]
+
     try:
-        python_candidates: List[List[str]] = []
-        if not is_frozen():
-            python_candidates.append([sys.executable])
-        python_candidates.extend(
-            [
-                ["py", "-3.12"],
-                ["py", "-3"],
-                ["python"],
-            ]
+        free_bytes = shutil.disk_usage(root).free
+    except OSError:
+        free_bytes = 0
+    result: Tuple[bool, str] = (True, "")
+    if free_bytes and free_bytes < INSTALL_REQUIRED_FREE_BYTES:
+        free_gb = round(free_bytes / (1024 ** 3), 2)
+        required_gb = round(INSTALL_REQUIRED_FREE_BYTES / (1024 ** 3), 0)
+        result = (
+            False,
+            f"Not enough free disk space to install GPU OCR. "
+            f"Free about {required_gb} GB on drive {root} "
+            f"(currently {free_gb} GB free).",
         )
+    with _disk_space_lock:
+        _disk_space_cache[root] = (now, result)
+    return result
+
+
+_PY_LAUNCHER_LINE_RE = re.compile(r"^\s*-(?:V:)?(\d+)\.(\d+)\S*\s+(?:\*\s+)?(.+?)\s*$")
+PREFERRED_PYTHON_VERSION = (3, 12)
+
+
+def _is_store_stub(path: str) -> bool:
+    return "windowsapps" in path.lower()
+
+
+def parse_py_launcher_listing(output: str) -> List[Tuple[Tuple[int, int], str]]:
+    """Parse ``py -0p`` output into ``[((major, minor), exe_path), ...]``."""
+    installs: List[Tuple[Tuple[int, int], str]] = []
+    for line in output.splitlines():
+        match = _PY_LAUNCHER_LINE_RE.match(line)
+        if not match:
+            continue
+        exe_path = match.group(3)
+        if _is_store_stub(exe_path):
+            continue
+        installs.append(((int(match.group(1)), int(match.group(2))), exe_path))
+    return installs
+
+
+def _pick_launcher_python(installs: List[Tuple[Tuple[int, int], str]]) -> Optional[str]:
+    for version, exe_path in installs:
+        if version == PREFERRED_PYTHON_VERSION:
+            return exe_path
+    python3 = [item for item in installs if item[0][0] == 3]
+    if not python3:
+        return None
+    return max(python3, key=lambda item: item[0])[1]
 
-        chosen_python: Optional[List[str]] = None
-        for candidate in python_candidates:
-            probe = subprocess.run(
-                [*candidate, "-V"],
+
+def find_install_python() -> Optional[Tuple[List[str], str]]:
+    """Return ``(argv, exe_path)`` for the Python that should receive the GPU OCR packages."""
+    if not is_frozen():
+        return [sys.executable], sys.executable
+
+    if sys.platform.startswith("win"):
+        # One launcher call lists every install instead of spawning a probe per candidate.
+        try:
+            listing = subprocess.run(
+                ["py", "-0p"],
                 capture_output=True,
                 text=True,
                 timeout=10,
             )
-            if probe.returncode == 0:
-                chosen_python = candidate
-                break
+        except (OSError, subprocess.SubprocessError):
+            listing = None
+        if listing is not None and listing.returncode == 0:
+            exe_path = _pick_launcher_python(parse_py_launcher_listing(listing.stdout or ""))
+            if exe_path:
+                return [exe_path], exe_path
+        names = ["python"]
+    else:
+        names = ["python3.12", "python3", "python"]
 
-        if chosen_python is None:
-            return {
-                "ok": False,
-                "message": "No system Python found. Install Python 3.12+ and try again.",
-            }, 400
+    for name in names:
+        exe_path = shutil.which(name)
+        if exe_path and not _is_store_stub(exe_path):
+            return [exe_path], exe_path
+    return None
 
-        python_path_probe = subprocess.run(
-            [*chosen_python, "-c", "import sys; print(sys.executable)"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        python_exe_path = (python_path_probe.stdout or "").strip()
-        if not python_exe_path:
-            python_exe_path = " ".join(chosen_python)
 
-        required_bytes = 10 * 1024 * 1024 * 1024
-        try:
-            free_bytes = shutil.disk_usage(Path(python_exe_path).anchor or str(Path.home().anchor)).free
-        except Exception:
-            free_bytes = 0
-        if free_bytes and free_bytes < required_bytes:
-            free_gb = round(free_bytes / (1024 ** 3), 2)
-            required_gb = round(required_bytes / (1024 ** 3), 0)
+def install_gpu_ocr_dependencies() -> Tuple[Dict[str, Any], int]:
+    try:
+        found = find_install_python()
+        if found is None:
             return {
                 "ok": False,
-                "message": (
-                    f"Not enough free disk space to install GPU OCR. "
-                    f"Free about {required_gb} GB on drive {Path(python_exe_path).anchor or 'system drive'} "
-                    f"(currently {free_gb} GB free)."
-                ),
+                "message": "No system Python found. Install Python 3.12+ and try again.",
             }, 400
+        chosen_python, python_exe_path = found
+
+        has_space, space_message = check_install_disk_space(python_exe_path)
+        if not has_space:
+            return {"ok": False, "message": space_message}, 400
 
         purge_cache_cmd = [*chosen_python, "-m", "pip", "cache", "purge"]
         subprocess.run(
@@ -10,6 +10,7 @@ from flask import Blueprint
 class VodDownloadRouteDeps:
     vod_download_start_response: Callable[[], Any]
     vod_download_progress_response: Callable[[str], Any]
+    vod_download_progress_stream_response: Callable[[str], Any]
     vod_check_tools_response: Callable[[], Any]
 
 
@@ -24,6 +25,10 @@ def create_vod_download_blueprint(deps: VodDownloadRouteDeps) -> Blueprint:
     def vod_download_progress(job_id: str) -> Any:
         return deps.vod_download_progress_response(job_id)
 
+    @vod_download_bp.route("/api/vod/progress-stream/<job_id>", methods=["GET"])
+    def vod_download_progress_stream(job_id: str) -> Any:
+        return deps.vod_download_progress_stream_response(job_id)
+
     @vod_download_bp.route("/api/vod/check-tools", methods=["GET"])
     def vod_check_tools() -> Any:
         return deps.vod_check_tools_response()
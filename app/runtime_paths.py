@@ -4,9 +4,10 @@ import os
 import shutil
 import sys
 import logging
+import threading
 import zipfile
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -187,12 +188,33 @@ def _extract_tool_zip(name: str, tools_dir: Path) -> Optional[Path]:
         return None
 
 
+_resolved_tools_lock = threading.Lock()
+_resolved_tools: Dict[Tuple[str, ...], str] = {}
+
+
 def resolve_tool(name: str, extra_names: Optional[Iterable[str]] = None) -> Optional[str]:
     names = [name]
     if extra_names:
         names.extend(extra_names)
 
-    logger.info(f"Resolving tool: {name}, extra_names: {list(extra_names) if extra_names else []}")
+    # Every clip, thumbnail and download resolves its tool; reuse the last hit while it still exists.
+    cache_key = tuple(names)
+    with _resolved_tools_lock:
+        cached = _resolved_tools.get(cache_key)
+    if cached and os.path.isfile(cached):
+        return cached
+
+    found = _resolve_tool_uncached(name, names)
+    with _resolved_tools_lock:
+        if found:
+            _resolved_tools[cache_key] = found
+        else:
+            _resolved_tools.pop(cache_key, None)
+    return found
+
+
+def _resolve_tool_uncached(name: str, names: List[str]) -> Optional[str]:
+    logger.info(f"Resolving tool: {name}, extra_names: {names[1:]}")
     
     # Try PATH first
     for tool_name in names:
@@ -19,13 +19,13 @@ from app.system.subprocess_policy import UnsafePathError, ffmpeg_argv, normalize
 from app.system.path_policy import normalize_allowed_dirs
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipWindow:
     start: float
     end: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BookmarkEvent:
     time: float
     event: str
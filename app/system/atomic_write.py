@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+
+REPLACE_RETRY_ATTEMPTS = 3
+REPLACE_RETRY_DELAY_SECONDS = 0.05
+
+# Read once at import; os.umask can only be queried by setting it, which is not thread-safe.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _target_mode(path: Path) -> int:
+    """Mode the written file should end up with: the existing file's, else what open() would give."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def write_text_atomic(path: Path, text: str, *, fsync: bool = False, encoding: str = "utf-8") -> None:
+    """Write ``text`` to a sibling temp file and swap it into place with ``os.replace``.
+
+    Readers never observe a half-written file. ``fsync`` flushes the data to
+    disk before the swap, for files that must survive a crash (e.g. config).
+    The target keeps its permissions (``mkstemp`` would otherwise leave 0600).
+    Raises ``PermissionError`` if the swap is still refused after the retries.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as handle:
+            handle.write(text)
+            if fsync:
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.chmod(tmp_name, _target_mode(path))
+        for attempt in range(REPLACE_RETRY_ATTEMPTS):
+            try:
+                os.replace(tmp_name, path)
+                return
+            except PermissionError:
+                # Windows refuses the swap while another process briefly holds the target open.
+                if attempt == REPLACE_RETRY_ATTEMPTS - 1:
+                    raise
+                time.sleep(REPLACE_RETRY_DELAY_SECONDS)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
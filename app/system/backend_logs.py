@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from app.runtime_paths import resolve_log_path
 
@@ -12,17 +14,62 @@ def get_backend_log_path(config: Dict[str, Any], config_path: Path) -> Path:
     return resolve_log_path(config_path, config.get("logging", {}).get("file", "app.log"))
 
 
+TAIL_CHUNK_SIZE = 64 * 1024
+
+
 def tail_lines(path: Path, max_lines: int = 200) -> List[str]:
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return []
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    return lines[-max_lines:]
+    return list(_read_tail_lines(str(path), stat.st_mtime_ns, stat.st_size, max_lines))
+
+
+@lru_cache(maxsize=8)
+def _read_tail_lines(path: str, mtime_ns: int, size: int, max_lines: int) -> Tuple[str, ...]:
+    """Read the last ``max_lines`` lines by walking fixed-size chunks back from EOF.
+
+    ``mtime_ns`` and ``size`` only participate in the cache key so repeated
+    polls of an unchanged log are served from memory.
+    """
+    if max_lines <= 0 or size <= 0:
+        return ()
+
+    chunks: List[bytes] = []
+    newline_count = 0
+    position = size
+    try:
+        with open(path, "rb") as handle:
+            while position > 0 and newline_count <= max_lines:
+                read_size = min(TAIL_CHUNK_SIZE, position)
+                position -= read_size
+                handle.seek(position)
+                chunk = handle.read(read_size)
+                chunks.append(chunk)
+                newline_count += chunk.count(b"\n")
+    except OSError:
+        return ()
+
+    lines = b"".join(reversed(chunks)).decode("utf-8", errors="ignore").splitlines()
+    if position > 0 and lines:
+        # The first line starts mid-way through the file.
+        lines = lines[1:]
+    return tuple(lines[-max_lines:])
 
 
 def open_backend_log(log_path: Path) -> None:
     if sys.platform.startswith("win"):
-        subprocess.Popen(["notepad", str(log_path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    elif sys.platform == "darwin":
-        subprocess.Popen(["open", "-a", "TextEdit", str(log_path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # ShellExecute hands the file to the default editor without a child process handle.
+        os.startfile(str(log_path))  # type: ignore[attr-defined]
+        return
+    if sys.platform == "darwin":
+        cmd = ["open", "-a", "TextEdit", str(log_path)]
     else:
-        subprocess.Popen(["xdg-open", str(log_path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
\ No newline at end of file
+        cmd = ["xdg-open", str(log_path)]
+    subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
\ No newline at end of file
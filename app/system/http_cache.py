@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import re
 from typing import Any
 
+IMMUTABLE_MAX_AGE_SECONDS = 365 * 24 * 60 * 60
+
+# Vite emits bundle files as assets/<name>-<8 char content hash>.<ext>.
+_HASHED_ASSET_RE = re.compile(r"^assets/[^/]+-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+
 
 def set_no_cache_headers(
     response: Any,
@@ -13,4 +19,13 @@ def set_no_cache_headers(
     if include_pragma:
         response.headers["Pragma"] = "no-cache"
     response.headers["Expires"] = "0"
-    return response
\ No newline at end of file
+    return response
+
+
+def is_hashed_asset_path(path: str) -> bool:
+    return bool(_HASHED_ASSET_RE.match(path.replace("\\", "/")))
+
+
+def set_immutable_cache_headers(response: Any) -> Any:
+    response.headers["Cache-Control"] = f"public, max-age={IMMUTABLE_MAX_AGE_SECONDS}, immutable"
+    return response
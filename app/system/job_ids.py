@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+
+# Python 3.14+ ships RFC 9562 UUIDv7; older runtimes use the generator below.
+_native_uuid7 = getattr(uuid, "uuid7", None)
+
+_COUNTER_MAX = 0xFFF
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def _uuid7() -> uuid.UUID:
+    """RFC 9562 UUIDv7: 48-bit Unix ms timestamp, 12-bit counter, 62 random bits.
+
+    The counter (rand_a) keeps IDs monotonic within one millisecond; it is
+    seeded with its top bit clear and borrows the next millisecond on overflow.
+    """
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                _last_ms += 1
+                _counter = 0
+        unix_ms, counter = _last_ms, _counter
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (unix_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76
+    value |= counter << 64
+    value |= 0b10 << 62
+    value |= rand_b
+    return uuid.UUID(int=value)
+
+
+def new_job_uuid() -> uuid.UUID:
+    """Return a time-ordered UUIDv7, using the stdlib generator when available."""
+    if _native_uuid7 is not None:
+        return _native_uuid7()
+    return _uuid7()
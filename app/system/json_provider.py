@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None
+
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def dumps_indented(obj: Any) -> str:
+    """Encode ``obj`` as two-space indented JSON, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2)
+
+
+def loads_json(raw: str | bytes) -> Any:
+    """Parse JSON text or bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson when it is installed.
+
+    Falls back to the stdlib provider when orjson is missing, when a caller
+    asks for formatting orjson cannot reproduce (``indent``, custom
+    separators), or when orjson rejects a value (e.g. integers over 64 bits).
+    """
+
+    def _orjson_options(self, kwargs: dict) -> Any:
+        if orjson is None:
+            return None
+        extra = dict(kwargs)
+        if extra.pop("separators", _COMPACT_SEPARATORS) != _COMPACT_SEPARATORS:
+            return None
+        sort_keys = extra.pop("sort_keys", self.sort_keys)
+        extra.pop("default", None)
+        if extra:
+            return None
+        # Pass datetimes through to Flask's default so they keep the HTTP date format.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = self._orjson_options(kwargs)
+        if option is not None:
+            try:
+                return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode("utf-8")
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
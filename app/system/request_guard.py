@@ -53,6 +53,9 @@ class RequestGuardConfig:
     heavy_limit_window_seconds: int
     rate_state_max_keys: int
     rate_state_idle_ttl_seconds: int
+    # Per actor and per job: the download modal polls progress twice a second.
+    poll_limit_count: int = 20
+    poll_limit_window_seconds: int = 5
 
 
 class RequestGuard:
@@ -74,6 +77,8 @@ class RequestGuard:
             "/api/clip-range",
             "/api/split-selected",
         )
+        # GET endpoints that clients poll on a timer; rate-limited per actor and full path.
+        self._poll_paths = ("/api/vod/progress/",)
         self._public_safe_api_paths = (
             "/api/health",
             "/api/healthz",
@@ -110,6 +115,18 @@ class RequestGuard:
     def _is_heavy_path(self, path: str) -> bool:
         return path.startswith(self._heavy_paths)
 
+    def _is_poll_path(self, path: str) -> bool:
+        return path.startswith(self._poll_paths)
+
+    def _rate_limits_for(self, path: str, method: str) -> tuple[int, int] | None:
+        if method in self._mutating_methods:
+            if self._is_heavy_path(path):
+                return self._config.heavy_limit_count, self._config.heavy_limit_window_seconds
+            return self._config.default_limit_count, self._config.default_limit_window_seconds
+        if method == "GET" and self._is_poll_path(path):
+            return self._config.poll_limit_count, self._config.poll_limit_window_seconds
+        return None
+
     def _has_valid_api_token(self, request: Request) -> bool:
         expected = self._config.api_token
         if not expected:
@@ -132,18 +149,15 @@ class RequestGuard:
         actor = token_hint[:12] if token_hint else remote_addr
         return f"{actor}:{path}"
 
-    def _allow_rate(self, request: Request, path: str) -> tuple[bool, str, int]:
+    def _allow_rate(self, request: Request, path: str, method: str) -> tuple[bool, str, int]:
         if not self._config.rate_limit_enabled:
             return True, "", 200
+        limits = self._rate_limits_for(path, method)
+        if limits is None:
+            return True, "", 200
 
         now = time.time()
-        is_heavy = self._is_heavy_path(path)
-        max_count = self._config.heavy_limit_count if is_heavy else self._config.default_limit_count
-        window = (
-            self._config.heavy_limit_window_seconds
-            if is_heavy
-            else self._config.default_limit_window_seconds
-        )
+        max_count, window = limits
         key = self._rate_limit_key(request, path)
 
         with self._rate_lock:
@@ -191,28 +205,19 @@ class RequestGuard:
         token_protected = self._is_token_protected_path(path, method)
 
         if not token_protected:
-            return True, "", 200
+            return self._allow_rate(request, path, method)
 
         if self._config.require_api_token:
             if not self._has_valid_api_token(request):
                 return False, "Missing or invalid API token.", 401
-            if method in self._mutating_methods:
-                allowed, message, status_code = self._allow_rate(request, path)
-                if not allowed:
-                    return False, message, status_code
-            return True, "", 200
+            return self._allow_rate(request, path, method)
 
         # When token auth is not enforced (development/browser mode), require
         # same-origin loopback context for sensitive routes.
         if not self._has_trusted_origin(request):
             return False, "Untrusted request origin.", 403
 
-        if method in self._mutating_methods:
-            allowed, message, status_code = self._allow_rate(request, path)
-            if not allowed:
-                return False, message, status_code
-
-        return True, "", 200
+        return self._allow_rate(request, path, method)
 
 
 def load_request_guard_from_env() -> RequestGuard:
@@ -227,5 +232,7 @@ def load_request_guard_from_env() -> RequestGuard:
             heavy_limit_window_seconds=_parse_int_env("AET_HEAVY_RATE_LIMIT_WINDOW_SECONDS", 60),
             rate_state_max_keys=_parse_int_env("AET_RATE_STATE_MAX_KEYS", 4096),
             rate_state_idle_ttl_seconds=_parse_int_env("AET_RATE_STATE_IDLE_TTL_SECONDS", 600),
+            poll_limit_count=_parse_int_env("AET_POLL_RATE_LIMIT_COUNT", 20),
+            poll_limit_window_seconds=_parse_int_env("AET_POLL_RATE_LIMIT_WINDOW_SECONDS", 5),
         )
     )
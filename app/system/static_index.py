@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional, Tuple
+
+STATIC_INDEX_REVALIDATE_SECONDS = 1.0
+
+
+def _normalize_key(relative_path: str) -> str:
+    return os.path.normcase(os.path.normpath(relative_path))
+
+
+def _walk_static_root(root: Path) -> Optional[Tuple[Dict[str, int], FrozenSet[str]]]:
+    """Return ``(dir_mtimes_ns, relative_file_keys)`` for every file under ``root``.
+
+    Symlinked directories are followed once each; a link back to a directory
+    already walked (a symlink loop) is skipped.
+    """
+    root_str = str(root)
+    try:
+        root_stat = os.stat(root_str)
+    except OSError:
+        return None
+    dir_mtimes = {root_str: root_stat.st_mtime_ns}
+    # os.stat rather than DirEntry.stat: the latter leaves st_dev/st_ino zeroed on Windows.
+    visited = {(root_stat.st_dev, root_stat.st_ino)}
+    files = set()
+    pending = [root_str]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            dir_stat = os.stat(entry.path)
+                            identity = (dir_stat.st_dev, dir_stat.st_ino)
+                            if identity in visited:
+                                continue
+                            visited.add(identity)
+                            dir_mtimes[entry.path] = dir_stat.st_mtime_ns
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            files.add(_normalize_key(os.path.relpath(entry.path, root_str)))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return dir_mtimes, frozenset(files)
+
+
+class StaticFileIndex:
+    """In-memory listing of a static build directory.
+
+    Lookups are served from a set of relative file paths. The directory mtimes
+    are rechecked at most once per ``revalidate_seconds`` and the set is rebuilt
+    when any of them changed (e.g. after ``npm run build``).
+    """
+
+    def __init__(self, root: Path, revalidate_seconds: float = STATIC_INDEX_REVALIDATE_SECONDS) -> None:
+        self.root = Path(root)
+        self._revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._dir_mtimes: Optional[Dict[str, int]] = None
+        self._files: FrozenSet[str] = frozenset()
+        self._checked_at: Optional[float] = None
+
+    def _is_stale(self) -> bool:
+        if self._dir_mtimes is None:
+            return True
+        for directory, mtime_ns in self._dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self._revalidate_seconds:
+                return
+            self._checked_at = now
+            if not self._is_stale():
+                return
+            walked = _walk_static_root(self.root)
+            if walked is None:
+                self._dir_mtimes = None
+                self._files = frozenset()
+            else:
+                self._dir_mtimes, self._files = walked
+
+    def root_exists(self) -> bool:
+        self._refresh()
+        return self._dir_mtimes is not None
+
+    def contains(self, relative_path: str) -> bool:
+        if not relative_path:
+            return False
+        self._refresh()
+        return _normalize_key(relative_path) in self._files
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._dir_mtimes = None
+            self._checked_at = None
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import subprocess
+import time
 from pathlib import Path
 
 from app.runtime_paths import build_mode_command, get_config_path, get_downloads_dir, get_project_root, resolve_tool
@@ -10,6 +11,8 @@ from app.twitch.jobs import read_twitch_job, write_twitch_job
 
 CONFIG_PATH = get_config_path()
 DOWNLOADS_DIR = get_downloads_dir()
+# yt-dlp prints progress several times per second; the job file only needs to keep up with UI polling.
+PROGRESS_WRITE_INTERVAL_SECONDS = 0.5
 
 
 def run_twitch_import(job_id: str, url: str) -> None:
@@ -43,6 +46,20 @@ def run_twitch_import(job_id: str, url: str) -> None:
         text=True,
     )
 
+    last_progress_write = 0.0
+
+    def write_progress() -> None:
+        nonlocal last_progress_write
+        now = time.monotonic()
+        if now - last_progress_write < PROGRESS_WRITE_INTERVAL_SECONDS:
+            return
+        try:
+            write_twitch_job(job_id, job)
+        except PermissionError:
+            # Windows refused the swap while a poller held the file; the next tick writes again.
+            return
+        last_progress_write = now
+
     assert proc.stdout is not None
     for line in proc.stdout:
         if "Destination:" in line:
@@ -64,7 +81,7 @@ def run_twitch_import(job_id: str, url: str) -> None:
                         "speed": speed_str or None,
                     }
                 )
-                write_twitch_job(job_id, job)
+                write_progress()
             continue
 
         match = progress_re.search(line)
@@ -73,7 +90,7 @@ def run_twitch_import(job_id: str, url: str) -> None:
             eta_match = eta_re.search(line)
             eta_value = eta_match.group(1) if eta_match else None
             job.update({"progress": round(progress_value, 1), "message": "Downloading", "eta": eta_value})
-            write_twitch_job(job_id, job)
+            write_progress()
 
     exit_code = proc.wait()
     if exit_code != 0:
@@ -1,22 +1,40 @@
 from __future__ import annotations
 
-import json
+import os
 import re
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from app.runtime_paths import get_downloads_dir
+from app.system.atomic_write import write_text_atomic
+from app.system.json_provider import dumps_indented, loads_json
 
 
 DOWNLOADS_DIR = get_downloads_dir()
 ACTIVE_TWITCH_JOB_STATUSES = {"queued", "downloading", "scanning"}
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_TWITCH_VOD_PATH_RE = re.compile(r"/videos/\d+/?")
+
+# Parsed job files keyed by path -> (mtime_ns, size, payload). Notification and
+# import-status polling re-read the same files far more often than they change.
+# Least recently read entries are dropped past MAX_CACHED_JOB_FILES.
+MAX_CACHED_JOB_FILES = 256
+_job_cache_lock = threading.Lock()
+_job_cache: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+
+
+def _forget_job_file(path: str) -> None:
+    with _job_cache_lock:
+        _job_cache.pop(path, None)
 
 
 def sanitize_filename(filename: str) -> str:
     name = Path(filename).name
-    name = re.sub(r"[^A-Za-z0-9._-]+", "_", name)
+    name = _UNSAFE_FILENAME_RE.sub("_", name)
     return name or "upload.mp4"
 
 
@@ -33,33 +51,68 @@ def is_twitch_vod_url(url: str) -> bool:
         return False
     if parsed.scheme != "https":
         return False
-    return bool(re.fullmatch(r"/videos/\d+/?", parsed.path or ""))
+    return _TWITCH_VOD_PATH_RE.fullmatch(parsed.path or "") is not None
+
+
+def _load_job_file(path: str, stat: Optional[os.stat_result] = None) -> Optional[Any]:
+    if stat is None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            _forget_job_file(path)
+            return None
+
+    with _job_cache_lock:
+        cached = _job_cache.get(path)
+        if cached is not None:
+            _job_cache.move_to_end(path)
+    if cached is None or cached[0] != stat.st_mtime_ns or cached[1] != stat.st_size:
+        try:
+            with open(path, "rb") as handle:
+                payload = loads_json(handle.read())
+        except (ValueError, OSError):
+            return None
+        cached = (stat.st_mtime_ns, stat.st_size, payload)
+        with _job_cache_lock:
+            _job_cache[path] = cached
+            _job_cache.move_to_end(path)
+            while len(_job_cache) > MAX_CACHED_JOB_FILES:
+                _job_cache.popitem(last=False)
+
+    payload = cached[2]
+    # Callers update the returned job in place; job payloads are flat, so a shallow copy suffices.
+    return dict(payload) if isinstance(payload, dict) else payload
 
 
 def write_twitch_job(job_id: str, payload: Dict[str, Any]) -> None:
     DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
     job_path = DOWNLOADS_DIR / f"job_{job_id}.json"
-    job_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    write_text_atomic(job_path, dumps_indented(payload))
+    _forget_job_file(str(job_path))
 
 
 def read_twitch_job(job_id: str) -> Optional[Dict[str, Any]]:
-    job_path = DOWNLOADS_DIR / f"job_{job_id}.json"
-    if not job_path.exists():
-        return None
-    try:
-        return json.loads(job_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return None
+    return _load_job_file(str(DOWNLOADS_DIR / f"job_{job_id}.json"))
 
 
 def list_twitch_jobs(limit: int = 20) -> List[Dict[str, Any]]:
-    if not DOWNLOADS_DIR.exists():
+    try:
+        with os.scandir(DOWNLOADS_DIR) as it:
+            candidates = []
+            for entry in it:
+                if not (entry.name.startswith("job_") and entry.name.endswith(".json")):
+                    continue
+                try:
+                    candidates.append((entry.path, entry.stat()))
+                except OSError:
+                    continue
+    except OSError:
         return []
+    candidates.sort(key=lambda item: item[1].st_mtime, reverse=True)
     jobs = []
-    for path in sorted(DOWNLOADS_DIR.glob("job_*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+    for path, stat in candidates:
+        payload = _load_job_file(path, stat)
+        if payload is None:
             continue
         jobs.append(payload)
         if len(jobs) >= limit:
@@ -82,7 +135,7 @@ def prune_stale_twitch_jobs(max_age_seconds: int = 6 * 60 * 60) -> int:
 
     for path in DOWNLOADS_DIR.glob("job_*.json"):
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = loads_json(path.read_bytes())
         except Exception:
             continue
 
@@ -94,6 +147,7 @@ def prune_stale_twitch_jobs(max_age_seconds: int = 6 * 60 * 60) -> int:
             if path.stat().st_mtime >= cutoff:
                 continue
             path.unlink(missing_ok=True)
+            _forget_job_file(str(path))
             removed += 1
         except Exception:
             continue
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 
 
 _STATUS_MAP = {
+    "queued": "queued",
     "initializing": "downloading",
     "fetching_metadata": "downloading",
     "downloading": "downloading",
@@ -11,23 +13,45 @@ _STATUS_MAP = {
     "error": "failed",
 }
 
+# Converted job lists per downloader, reused until the downloader's revision changes.
+_jobs_by_downloader: "weakref.WeakKeyDictionary[Any, Tuple[int, Tuple[Dict[str, Any], ...]]]" = (
+    weakref.WeakKeyDictionary()
+)
 
-def vod_downloader_as_twitch_jobs(vod_downloader: Optional[Any]) -> List[Dict[str, Any]]:
+def _serialize_jobs(vod_downloader: Any) -> List[Dict[str, Any]]:
+    status_map = _STATUS_MAP
+    return [
+        {
+            "id": job_id,
+            "url": job.get("url", ""),
+            "status": status_map.get(job.get("status", ""), "downloading"),
+            "progress": job.get("percentage", 0),
+            "message": job.get("error") or job.get("status", ""),
+            "eta": job.get("eta"),
+            "speed": job.get("speed"),
+            "started_at": job.get("started_at"),
+            "updated_at": job.get("updated_at"),
+        }
+        for job_id, job in vod_downloader.list_jobs()
+    ]
+
+
+def vod_downloader_as_twitch_jobs(vod_downloader: Optional[Any]) -> Tuple[Dict[str, Any], ...]:
+    """Return the downloader's jobs in the Twitch job format.
+
+    Notification polling hits this far more often than jobs change, so the
+    converted tuple is shared between calls for the same revision; callers
+    must treat it and its dicts as read-only.
+    """
     if not vod_downloader:
-        return []
-    result = []
-    for job_id, job in vod_downloader.list_jobs():
-        result.append(
-            {
-                "id": job_id,
-                "url": job.get("url", ""),
-                "status": _STATUS_MAP.get(job.get("status", ""), "downloading"),
-                "progress": job.get("percentage", 0),
-                "message": job.get("error") or job.get("status", ""),
-                "eta": job.get("eta"),
-                "speed": job.get("speed"),
-                "started_at": job.get("started_at"),
-                "updated_at": job.get("updated_at"),
-            }
-        )
-    return result
\ No newline at end of file
+        return ()
+    revision = getattr(vod_downloader, "revision", None)
+    if not isinstance(revision, int):
+        return tuple(_serialize_jobs(vod_downloader))
+
+    cached = _jobs_by_downloader.get(vod_downloader)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+    result = tuple(_serialize_jobs(vod_downloader))
+    _jobs_by_downloader[vod_downloader] = (revision, result)
+    return result
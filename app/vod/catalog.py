@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from app.clips.insights import format_timestamp, parse_vod_timestamp
 from app.runtime_paths import get_downloads_dir
@@ -10,6 +14,15 @@ from app.vod.stem import sanitize_stem
 
 DOWNLOADS_DIR = get_downloads_dir()
 
+# Persistent pool so VOD folders on different drives are scanned concurrently;
+# scandir/stat release the GIL, and threads are only spawned on first use.
+_SCAN_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="vod-scan")
+
+_T = TypeVar("_T")
+
+# Directory listings kept by VodIndex; the least recently used is dropped beyond this.
+MAX_INDEXED_DIRECTORIES = 32
+
 
 def get_clips_dir(config: Dict[str, Any]) -> Path:
     vods_dir = Path(config.get("replay", {}).get("directory", ""))
@@ -31,62 +44,173 @@ def get_vod_dirs(config: Dict[str, Any]) -> List[Path]:
     return dirs
 
 
-def get_vod_paths(directories: List[Path], extensions: List[str]) -> List[Path]:
-    files: List[Path] = []
-    allowed = {e.lower() for e in extensions}
-    for directory in directories:
-        if not directory.exists():
-            continue
-        for path in directory.iterdir():
-            if not path.is_file():
-                continue
-            if allowed and path.suffix.lower() not in allowed:
-                continue
-            if path.stem.endswith(".temp") or path.suffix.lower() == ".part":
-                continue
-            files.append(path)
-    files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return files
-
-
-def build_session_entries(files: List[Path]) -> List[Dict[str, Any]]:
+def _scan_vod_directory(directory: Path) -> Optional[Tuple[int, List[Tuple[Path, os.stat_result]]]]:
+    """Return ``(dir_mtime_ns, [(path, stat), ...])`` for regular files in ``directory``."""
+    try:
+        dir_mtime_ns = directory.stat().st_mtime_ns
+    except OSError:
+        return None
+    entries: List[Tuple[Path, os.stat_result]] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((Path(entry.path), stat))
+    except OSError:
+        return None
+    return dir_mtime_ns, entries
+
+
+def _map_directories(func: Callable[[Path], _T], directories: List[Path]) -> List[_T]:
+    if len(directories) <= 1:
+        return [func(directory) for directory in directories]
+    return list(_SCAN_POOL.map(func, directories))
+
+
+def _filter_vod_entries(
+    entries: Iterable[Tuple[Path, os.stat_result]],
+    allowed: frozenset,
+) -> List[Tuple[Path, float]]:
     result = []
-    for path in files:
-        stat = path.stat()
-        result.append(
-            {
-                "name": path.name,
-                "path": str(path),
-                "mtime": stat.st_mtime,
-                "size": stat.st_size,
-            }
-        )
+    for path, stat in entries:
+        suffix = path.suffix.lower()
+        if allowed and suffix not in allowed:
+            continue
+        if path.stem.endswith(".temp") or suffix == ".part":
+            continue
+        result.append((path, stat.st_mtime))
     return result
 
 
-def list_sessions(directory: Path) -> List[Dict[str, Any]]:
-    if not directory.exists():
+def _sorted_vod_paths(entries: List[Tuple[Path, float]]) -> List[Path]:
+    entries.sort(key=lambda item: item[1], reverse=True)
+    return [path for path, _ in entries]
+
+
+def get_vod_paths(directories: List[Path], extensions: List[str]) -> List[Path]:
+    allowed = frozenset(e.lower() for e in extensions)
+    entries: List[Tuple[Path, float]] = []
+    for scanned in _map_directories(_scan_vod_directory, directories):
+        if scanned is None:
+            continue
+        entries.extend(_filter_vod_entries(scanned[1], allowed))
+    return _sorted_vod_paths(entries)
+
+
+class VodIndex:
+    """Cached VOD directory listings shared by the VOD list and stream endpoints.
+
+    A directory is rescanned only when its own mtime changes (a file was
+    added, removed or renamed), so a poll costs one stat per directory.
+    Files rewritten in place keep their cached mtime until the next rescan.
+    """
+
+    def __init__(self, max_directories: int = MAX_INDEXED_DIRECTORIES) -> None:
+        self._lock = threading.Lock()
+        self._max_directories = max(1, max_directories)
+        self._dirs: "OrderedDict[str, Tuple[int, List[Tuple[Path, os.stat_result]]]]" = OrderedDict()
+
+    def _directory_entries(self, directory: Path) -> List[Tuple[Path, os.stat_result]]:
+        key = str(directory)
+        try:
+            dir_mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._dirs.pop(key, None)
+            return []
+
+        with self._lock:
+            cached = self._dirs.get(key)
+            if cached is not None and cached[0] == dir_mtime_ns:
+                self._dirs.move_to_end(key)
+                return cached[1]
+
+        scanned = _scan_vod_directory(directory)
+        if scanned is None:
+            with self._lock:
+                self._dirs.pop(key, None)
+            return []
+        with self._lock:
+            self._dirs[key] = scanned
+            self._dirs.move_to_end(key)
+            while len(self._dirs) > self._max_directories:
+                self._dirs.popitem(last=False)
+        return scanned[1]
+
+    def get_vod_paths(self, directories: List[Path], extensions: List[str]) -> List[Path]:
+        allowed = frozenset(e.lower() for e in extensions)
+        entries: List[Tuple[Path, float]] = []
+        for dir_entries in _map_directories(self._directory_entries, directories):
+            entries.extend(_filter_vod_entries(dir_entries, allowed))
+        return _sorted_vod_paths(entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dirs.clear()
+
+
+vod_index = VodIndex()
+
+
+_SESSION_SUFFIXES = (".csv", ".jsonl")
+
+
+def _scan_session_files(directory: Path, name_prefix: str = "") -> List[Tuple[os.DirEntry, os.stat_result]]:
+    """List session files newest first, stating each entry once in a single scandir pass."""
+    found: List[Tuple[os.DirEntry, os.stat_result]] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(_SESSION_SUFFIXES) or not name.startswith(name_prefix):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    found.append((entry, entry.stat()))
+                except OSError:
+                    continue
+    except OSError:
         return []
-    files = list(directory.glob("*.csv")) + list(directory.glob("*.jsonl"))
-    files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return build_session_entries(files)
+    found.sort(key=lambda item: item[1].st_mtime, reverse=True)
+    return found
+
+
+def _session_entry(entry: os.DirEntry, stat: os.stat_result) -> Dict[str, Any]:
+    return {
+        "name": entry.name,
+        "path": entry.path,
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+    }
+
+
+def list_sessions(directory: Path, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    found = _scan_session_files(directory)
+    if limit is not None:
+        found = found[:limit]
+    return [_session_entry(entry, stat) for entry, stat in found]
 
 
 def list_sessions_for_vod(
     directory: Path,
     session_prefix: str,
     vod_stem: str,
+    limit: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
-    if not directory.exists():
-        return []
     safe_stem = sanitize_stem(vod_stem) or "vod"
-    pattern_csv = f"{session_prefix}_{safe_stem}_*.csv"
-    pattern_jsonl = f"{session_prefix}_{safe_stem}_*.jsonl"
-    files = list(directory.glob(pattern_csv)) + list(directory.glob(pattern_jsonl))
-    files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    entries = build_session_entries(files)
-    for entry in entries:
-        timestamp = parse_vod_timestamp(entry.get("name", ""))
-        display_name = format_timestamp(timestamp) if timestamp else entry.get("name", "")
-        entry["display_name"] = display_name
-    return entries
\ No newline at end of file
+    found = _scan_session_files(directory, f"{session_prefix}_{safe_stem}_")
+    if limit is not None:
+        found = found[:limit]
+    entries = []
+    for entry, stat in found:
+        session = _session_entry(entry, stat)
+        timestamp = parse_vod_timestamp(entry.name)
+        session["display_name"] = format_timestamp(timestamp) if timestamp else entry.name
+        entries.append(session)
+    return entries
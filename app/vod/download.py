@@ -9,9 +9,11 @@ import json
 import logging
 import subprocess
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from app.runtime_paths import resolve_tool
 from app.vod.download_utils import (
@@ -23,21 +25,140 @@ from app.vod.download_utils import (
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_DOWNLOADS = 2
+YT_DLP_CHECK_TTL_SECONDS = 60.0
+FINISHED_JOB_TTL_SECONDS = 3600.0
+MAX_TRACKED_JOBS = 1000
+TERMINAL_JOB_STATUSES = frozenset({"completed", "error"})
+
 
 class TwitchVODDownloader:
     """Download Twitch VODs using yt-dlp with progress tracking."""
 
-    def __init__(self, output_dir: Path):
+    def __init__(
+        self,
+        output_dir: Path,
+        max_concurrent_downloads: int = MAX_CONCURRENT_DOWNLOADS,
+        finished_job_ttl_seconds: float = FINISHED_JOB_TTL_SECONDS,
+        max_jobs: int = MAX_TRACKED_JOBS,
+    ):
         self.output_dir = Path(output_dir)
-        self.jobs: Dict[str, Dict[str, Any]] = {}
+        # Insertion-ordered so the oldest finished jobs are evicted first once over max_jobs.
+        self.jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._finished_at: Dict[str, float] = {}
+        self._finished_job_ttl_seconds = finished_job_ttl_seconds
+        self._max_jobs = max(1, max_jobs)
         self._lock = threading.Lock()
+        self._revision = 0
+        # Per-job revision and wait condition, so a progress tick only wakes streams for that job.
+        self._job_revisions: Dict[str, int] = {}
+        self._job_changed: Dict[str, threading.Condition] = {}
+        # Extra jobs wait as "queued" instead of all downloads competing for bandwidth and disk.
+        self._download_slots = threading.BoundedSemaphore(max(1, max_concurrent_downloads))
+        self._yt_dlp_check: Optional[Tuple[float, Optional[str], bool]] = None
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every job state change, for callers that memoize job views."""
+        with self._lock:
+            return self._revision
+
+    def _bump_revision_locked(self, job_ids: Iterable[str]) -> None:
+        self._revision += 1
+        for job_id in job_ids:
+            if job_id in self.jobs:
+                self._job_revisions[job_id] = self._revision
+                changed = self._job_changed.get(job_id)
+            else:
+                # Removed jobs wake their waiters, which then see the job is gone.
+                self._job_revisions.pop(job_id, None)
+                changed = self._job_changed.pop(job_id, None)
+            if changed is not None:
+                changed.notify_all()
+
+    def wait_for_job_change(
+        self,
+        job_id: str,
+        since_revision: int,
+        timeout: float,
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Block until ``job_id`` changes after ``since_revision`` (or ``timeout``).
+
+        Returns the job's current revision and a snapshot of it (``None`` once
+        the job is gone). Changes to other jobs do not wake the caller.
+        """
+        with self._lock:
+            if job_id in self.jobs:
+                changed = self._job_changed.get(job_id)
+                if changed is None:
+                    changed = self._job_changed[job_id] = threading.Condition(self._lock)
+                changed.wait_for(lambda: self._job_revisions.get(job_id, 0) != since_revision, timeout=timeout)
+            job = self.jobs.get(job_id)
+            return self._job_revisions.get(job_id, 0), dict(job) if job is not None else None
+
+    def _update_job(self, job_id: str, **fields: Any) -> Dict[str, Any]:
+        """Apply ``fields`` and return a snapshot taken under the lock.
+
+        Callbacks get the snapshot, since a finished job may be pruned or
+        evicted from ``jobs`` as soon as the lock is released.
+        """
+        with self._lock:
+            job = self.jobs[job_id]
+            job.update(fields)
+            job["updated_at"] = datetime.now(timezone.utc).isoformat()
+            if job.get("status") in TERMINAL_JOB_STATUSES:
+                self._finished_at.setdefault(job_id, time.monotonic())
+            self._bump_revision_locked((job_id,))
+            return dict(job)
+
+    def _prune_finished_jobs_locked(self) -> None:
+        """Drop completed/failed jobs once they have been finished for the TTL."""
+        if not self._finished_at:
+            return
+        cutoff = time.monotonic() - self._finished_job_ttl_seconds
+        # Entries are added in finish order, so the first one is the oldest; checking it keeps
+        # the common no-expiry case O(1) for every progress poll.
+        if next(iter(self._finished_at.values())) > cutoff:
+            return
+        expired = [job_id for job_id, finished in self._finished_at.items() if finished <= cutoff]
+        for job_id in expired:
+            self._finished_at.pop(job_id, None)
+            self.jobs.pop(job_id, None)
+        if expired:
+            self._bump_revision_locked(expired)
+
+    def _evict_excess_jobs_locked(self) -> None:
+        """Drop the oldest finished jobs while more than ``max_jobs`` are tracked.
+
+        Active jobs are never evicted; their workers still update them.
+        """
+        excess = len(self.jobs) - self._max_jobs
+        if excess <= 0:
+            return
+        evicted = [job_id for job_id in self.jobs if job_id in self._finished_at][:excess]
+        for job_id in evicted:
+            self._finished_at.pop(job_id, None)
+            del self.jobs[job_id]
+        self._bump_revision_locked(evicted)
 
     def check_yt_dlp(self) -> bool:
-        """Check if yt-dlp is installed and accessible."""
+        """Check if yt-dlp is installed and accessible.
+
+        The result is reused for ``YT_DLP_CHECK_TTL_SECONDS`` so polling the
+        tools endpoint does not spawn ``yt-dlp --version`` every time.
+        """
         yt_dlp_path = self._resolve_yt_dlp_path()
-        if not yt_dlp_path:
-            return False
+        now = time.monotonic()
+        cached = self._yt_dlp_check
+        if cached is not None and cached[1] == yt_dlp_path and now - cached[0] < YT_DLP_CHECK_TTL_SECONDS:
+            return cached[2]
+
+        available = bool(yt_dlp_path) and self._probe_yt_dlp(yt_dlp_path)
+        self._yt_dlp_check = (now, yt_dlp_path, available)
+        return available
 
+    @staticmethod
+    def _probe_yt_dlp(yt_dlp_path: str) -> bool:
         try:
             subprocess.run(
                 [yt_dlp_path, "--version"],
@@ -45,16 +166,16 @@ class TwitchVODDownloader:
                 check=True,
                 timeout=5,
             )
-            return True
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
             return False
+        return True
 
     @staticmethod
     def _resolve_yt_dlp_path() -> Optional[str]:
         return resolve_tool("yt-dlp", ["yt-dlp.exe"])
 
-    def validate_url(self, url: str) -> bool:
-        return validate_twitch_vod_url(url)
+    # Bound directly so validation is a single call into the precompiled URL pattern.
+    validate_url = staticmethod(validate_twitch_vod_url)
 
     def start_download(
         self,
@@ -63,6 +184,10 @@ class TwitchVODDownloader:
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> None:
         with self._lock:
+            self._prune_finished_jobs_locked()
+            self._finished_at.pop(job_id, None)
+            # A restarted job id counts as the newest entry.
+            self.jobs.pop(job_id, None)
             self.jobs[job_id] = {
                 "status": "initializing",
                 "url": url,
@@ -74,9 +199,11 @@ class TwitchVODDownloader:
                 "started_at": datetime.now(timezone.utc).isoformat(),
                 "updated_at": datetime.now(timezone.utc).isoformat(),
             }
+            self._evict_excess_jobs_locked()
+            self._bump_revision_locked((job_id,))
 
         thread = threading.Thread(
-            target=self._download_worker,
+            target=self._run_download_slot,
             args=(job_id, url, progress_callback),
             daemon=True,
         )
@@ -84,12 +211,30 @@ class TwitchVODDownloader:
 
     def list_jobs(self) -> List[Dict[str, Any]]:
         with self._lock:
+            self._prune_finished_jobs_locked()
             return list(self.jobs.items())
 
     def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
         with self._lock:
+            self._prune_finished_jobs_locked()
             return self.jobs.get(job_id)
 
+    def _run_download_slot(
+        self,
+        job_id: str,
+        url: str,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        if not self._download_slots.acquire(blocking=False):
+            # Report the wait explicitly so the UI can tell a queued job from a stuck one.
+            self._update_job(job_id, status="queued")
+            self._download_slots.acquire()
+            self._update_job(job_id, status="initializing")
+        try:
+            self._download_worker(job_id, url, progress_callback)
+        finally:
+            self._download_slots.release()
+
     def _download_worker(
         self,
         job_id: str,
@@ -98,44 +243,36 @@ class TwitchVODDownloader:
     ) -> None:
         try:
             if not self.check_yt_dlp():
-                with self._lock:
-                    self.jobs[job_id]["status"] = "error"
-                    self.jobs[job_id]["error"] = (
-                        "yt-dlp not installed. Install with: pip install yt-dlp"
-                    )
-                    self.jobs[job_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
+                snapshot = self._update_job(
+                    job_id,
+                    status="error",
+                    error="yt-dlp not installed. Install with: pip install yt-dlp",
+                )
                 if progress_callback:
-                    progress_callback(self.jobs[job_id])
+                    progress_callback(snapshot)
                 return
 
-            with self._lock:
-                self.jobs[job_id]["status"] = "fetching_metadata"
-                self.jobs[job_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
+            self._update_job(job_id, status="fetching_metadata")
 
             metadata = self._get_metadata(url)
             if not metadata:
-                with self._lock:
-                    self.jobs[job_id]["status"] = "error"
-                    self.jobs[job_id]["error"] = "Failed to fetch VOD metadata"
-                    self.jobs[job_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
+                snapshot = self._update_job(job_id, status="error", error="Failed to fetch VOD metadata")
                 if progress_callback:
-                    progress_callback(self.jobs[job_id])
+                    progress_callback(snapshot)
                 return
 
             filename = self._get_filename(metadata)
             output_path = self.output_dir / filename
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
-            with self._lock:
-                self.jobs[job_id]["status"] = "downloading"
-                self.jobs[job_id]["output_file"] = str(output_path)
-                self.jobs[job_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
-                duration_value = metadata.get("duration_seconds")
-                try:
-                    if duration_value is not None:
-                        self.jobs[job_id]["duration_seconds"] = float(duration_value)
-                except (TypeError, ValueError):
-                    pass
+            fields: Dict[str, Any] = {"status": "downloading", "output_file": str(output_path)}
+            duration_value = metadata.get("duration_seconds")
+            try:
+                if duration_value is not None:
+                    fields["duration_seconds"] = float(duration_value)
+            except (TypeError, ValueError):
+                pass
+            self._update_job(job_id, **fields)
 
             self._download_vod(job_id, url, output_path, progress_callback)
 
@@ -145,12 +282,9 @@ class TwitchVODDownloader:
                 job_id,
                 url,
             )
-            with self._lock:
-                self.jobs[job_id]["status"] = "error"
-                self.jobs[job_id]["error"] = str(exc)
-                self.jobs[job_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
+            snapshot = self._update_job(job_id, status="error", error=str(exc))
             if progress_callback:
-                progress_callback(self.jobs[job_id])
+                progress_callback(snapshot)
 
     def _get_metadata(self, url: str) -> Optional[Dict[str, Any]]:
         yt_dlp_path = self._resolve_yt_dlp_path()
@@ -225,7 +359,7 @@ class TwitchVODDownloader:
 
             assert process.stdout is not None
             for line in iter(process.stdout.readline, ""):
-                print(f"[vod_download] yt-dlp: {line!r}", flush=True)
+                logger.debug("yt-dlp output: job_id=%s line=%r", job_id, line)
                 stripped = line.strip()
                 if stripped:
                     last_output_line = stripped
@@ -234,12 +368,9 @@ class TwitchVODDownloader:
             process.wait()
 
             if process.returncode == 0 and output_path.exists():
-                with self._lock:
-                    self.jobs[job_id]["status"] = "completed"
-                    self.jobs[job_id]["percentage"] = 100
-                    self.jobs[job_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
+                snapshot = self._update_job(job_id, status="completed", percentage=100)
                 if progress_callback:
-                    progress_callback(self.jobs[job_id])
+                    progress_callback(snapshot)
                 return
 
             err_message = f"Download failed (exit code: {process.returncode})"
@@ -253,12 +384,9 @@ class TwitchVODDownloader:
                 process.returncode,
                 last_output_line,
             )
-            with self._lock:
-                self.jobs[job_id]["status"] = "error"
-                self.jobs[job_id]["error"] = err_message
-                self.jobs[job_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
+            snapshot = self._update_job(job_id, status="error", error=err_message)
             if progress_callback:
-                progress_callback(self.jobs[job_id])
+                progress_callback(snapshot)
 
         except Exception as exc:
             logger.exception(
@@ -267,12 +395,9 @@ class TwitchVODDownloader:
                 url,
                 output_path,
             )
-            with self._lock:
-                self.jobs[job_id]["status"] = "error"
-                self.jobs[job_id]["error"] = str(exc)
-                self.jobs[job_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
+            snapshot = self._update_job(job_id, status="error", error=str(exc))
             if progress_callback:
-                progress_callback(self.jobs[job_id])
+                progress_callback(snapshot)
 
     def _parse_progress(
         self,
@@ -283,19 +408,21 @@ class TwitchVODDownloader:
         parsed = parse_progress_template(output)
         if parsed:
             percentage, speed_str, eta_str = parsed
-            print(
-                f"[vod_download] parsed template: {percentage:.1f}% speed={speed_str!r} eta={eta_str!r}",
-                flush=True,
+            logger.debug(
+                "yt-dlp progress: job_id=%s percentage=%.1f speed=%r eta=%r",
+                job_id,
+                percentage,
+                speed_str,
+                eta_str,
             )
-            with self._lock:
-                self.jobs[job_id]["percentage"] = round(float(percentage), 1)
-                if speed_str:
-                    self.jobs[job_id]["speed"] = speed_str
-                if eta_str:
-                    self.jobs[job_id]["eta"] = eta_str
-                self.jobs[job_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
+            fields: Dict[str, Any] = {"percentage": round(float(percentage), 1)}
+            if speed_str:
+                fields["speed"] = speed_str
+            if eta_str:
+                fields["eta"] = eta_str
+            snapshot = self._update_job(job_id, **fields)
             if progress_callback:
-                progress_callback(self.jobs[job_id])
+                progress_callback(snapshot)
             return
 
         ffmpeg_parsed = parse_ffmpeg_progress(output)
@@ -320,9 +447,11 @@ class TwitchVODDownloader:
             elif speed_multiplier and speed_multiplier > 0:
                 job["speed"] = f"{speed_multiplier:.2f}x"
             job["updated_at"] = datetime.now(timezone.utc).isoformat()
+            self._bump_revision_locked((job_id,))
+            snapshot = dict(job)
 
         if progress_callback:
-            progress_callback(self.jobs[job_id])
+            progress_callback(snapshot)
 
     @staticmethod
     def _format_eta(total_seconds: float) -> str:
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import uuid
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
-from app.vod.download import TwitchVODDownloader
+from app.system.job_ids import new_job_uuid
+from app.vod.download import TERMINAL_JOB_STATUSES, TwitchVODDownloader
 
 
 def start_download_response(
@@ -32,7 +32,8 @@ def start_download_response(
             "install": "pip install yt-dlp",
         }, 400
 
-    job_id = str(uuid.uuid4())
+    # Time-ordered UUIDv7, so job ids sort by creation.
+    job_id = str(new_job_uuid())
     downloader.start_download(url, job_id)
     return {
         "job_id": job_id,
@@ -55,6 +56,30 @@ def progress_response(
     return progress, 200
 
 
+def iter_progress_updates(
+    downloader: TwitchVODDownloader,
+    job_id: str,
+    keepalive_seconds: float = 15.0,
+) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yield a job snapshot whenever it changes, or ``None`` when a keepalive is due.
+
+    Stops after the job reaches a terminal status or disappears.
+    """
+    revision = -1
+    last: Optional[Dict[str, Any]] = None
+    while True:
+        revision, job = downloader.wait_for_job_change(job_id, revision, keepalive_seconds)
+        if job is None:
+            return
+        if job == last:
+            yield None
+            continue
+        last = job
+        yield job
+        if job.get("status") in TERMINAL_JOB_STATUSES:
+            return
+
+
 def tools_check_response(
     downloader: Optional[TwitchVODDownloader],
 ) -> Tuple[Dict[str, Any], int]:
@@ -15,13 +15,16 @@ CLASSIC_ETA_RE = re.compile(r"ETA\s+([^\s]+)", re.IGNORECASE)
 FFMPEG_TIME_RE = re.compile(r"time=(\d{2}):(\d{2}):(\d{2}(?:\.\d+)?)")
 FFMPEG_SPEED_RE = re.compile(r"speed=\s*([\d.]+)x", re.IGNORECASE)
 FFMPEG_BITRATE_RE = re.compile(r"bitrate=\s*([\d.]+)kbits/s", re.IGNORECASE)
-TWITCH_VOD_URL_RE = re.compile(r"https?:\/\/(www\.)?twitch\.tv\/videos\/\d+")
+# Matched in full so trailing path junk is rejected; share links may carry ?t=... or a fragment.
+TWITCH_VOD_URL_RE = re.compile(r"https?://(?:www\.)?twitch\.tv/videos/\d+/?(?:[?#]\S*)?")
+# Characters Windows forbids in file names, replaced in one translate() pass.
+FILENAME_INVALID_CHARS_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
 
 
 def validate_twitch_vod_url(url: str) -> bool:
     if not url:
         return False
-    return bool(TWITCH_VOD_URL_RE.match(url))
+    return TWITCH_VOD_URL_RE.fullmatch(url) is not None
 
 
 def parse_progress_template(output: str) -> Optional[Tuple[float, str, str]]:
@@ -71,7 +74,6 @@ def parse_ffmpeg_progress(output: str) -> Optional[Tuple[float, Optional[float],
 
 
 def sanitize_filename(filename: str) -> str:
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, "_", filename)
+    sanitized = filename.translate(FILENAME_INVALID_CHARS_TABLE)
     sanitized = sanitized.strip(". ")
     return sanitized[:200]
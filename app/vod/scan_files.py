@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from app.runtime_paths import get_app_data_dir
-from app.vod.stem import sanitize_stem
+from app.vod.stem import sanitize_stem, session_file_globs, session_marker_names
 
 
 def resolve_bookmarks_context(config: Dict[str, Any]) -> Tuple[Path, str]:
@@ -25,10 +26,8 @@ def get_scan_marker_paths(
     session_prefix: str,
     vod_path_or_stem: str,
 ) -> Tuple[Path, Path]:
-    safe_stem = get_safe_vod_stem(vod_path_or_stem)
-    scanning_marker = bookmarks_dir / f"{session_prefix}_{safe_stem}.scanning"
-    paused_marker = bookmarks_dir / f"{session_prefix}_{safe_stem}.paused"
-    return scanning_marker, paused_marker
+    scanning_name, paused_name = session_marker_names(session_prefix, get_safe_vod_stem(vod_path_or_stem))
+    return bookmarks_dir / scanning_name, bookmarks_dir / paused_name
 
 
 def list_vod_session_files(
@@ -36,12 +35,45 @@ def list_vod_session_files(
     session_prefix: str,
     vod_path_or_stem: str,
 ) -> List[Path]:
-    safe_stem = get_safe_vod_stem(vod_path_or_stem)
-    pattern_csv = f"{session_prefix}_{safe_stem}_*.csv"
-    pattern_jsonl = f"{session_prefix}_{safe_stem}_*.jsonl"
+    pattern_csv, pattern_jsonl = session_file_globs(session_prefix, get_safe_vod_stem(vod_path_or_stem))
     return list(bookmarks_dir.glob(pattern_csv)) + list(bookmarks_dir.glob(pattern_jsonl))
 
 
+def unlink_matching_entries(directory: Path, matches: Callable[[str], bool]) -> int:
+    """Delete files in ``directory`` whose names satisfy ``matches`` in one scandir pass."""
+    removed = 0
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        if entry.is_dir() or not matches(entry.name):
+            continue
+        try:
+            os.unlink(entry.path)
+        except FileNotFoundError:
+            continue
+        removed += 1
+    return removed
+
+
+def delete_vod_session_artifacts(
+    bookmarks_dir: Path,
+    session_prefix: str,
+    vod_path_or_stem: str,
+) -> int:
+    safe_stem = get_safe_vod_stem(vod_path_or_stem)
+    session_head = f"{session_prefix}_{safe_stem}_"
+    marker_names = session_marker_names(session_prefix, safe_stem)
+
+    def matches(name: str) -> bool:
+        if name in marker_names:
+            return True
+        return name.startswith(session_head) and name.endswith((".csv", ".jsonl"))
+
+    return unlink_matching_entries(bookmarks_dir, matches)
+
+
 def find_vod_scan_state(
     bookmarks_dir: Path,
     session_prefix: str,
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
 import re
+from typing import Tuple
+
+_UNSAFE_STEM_RE = re.compile(r"[^a-zA-Z0-9_-]+")
 
 
 def sanitize_stem(value: str) -> str:
-    return re.sub(r"[^a-zA-Z0-9_-]+", "_", value).strip("_")
+    return _UNSAFE_STEM_RE.sub("_", value).strip("_")
+
+
+def session_marker_names(session_prefix: str, safe_stem: str) -> Tuple[str, str]:
+    """Return the ``(scanning, paused)`` marker file names for a VOD."""
+    return f"{session_prefix}_{safe_stem}.scanning", f"{session_prefix}_{safe_stem}.paused"
+
+
+def session_file_globs(session_prefix: str, safe_stem: str) -> Tuple[str, str]:
+    """Return the ``(csv, jsonl)`` glob patterns for a VOD's session files."""
+    return f"{session_prefix}_{safe_stem}_*.csv", f"{session_prefix}_{safe_stem}_*.jsonl"
@@ -6,6 +6,7 @@ from pathlib import Path
 from app.runtime_paths import get_app_data_dir, resolve_tool
 from app.system.path_policy import resolve_allowed_child_path
 from app.system.subprocess_policy import ffmpeg_argv, normalize_process_path
+from app.vod.scan_files import unlink_matching_entries
 from app.vod.stem import sanitize_stem
 
 
@@ -49,4 +50,12 @@ def ensure_vod_thumbnail(vod_path: Path, seconds: float) -> Path:
     thumb_path = get_vod_thumbnail_path(vod_path, seconds)
     if not thumb_path.exists():
         extract_vod_thumbnail(vod_path, seconds, thumb_path)
-    return thumb_path
\ No newline at end of file
+    return thumb_path
+
+
+def delete_vod_thumbnails(vod_path: Path) -> int:
+    thumb_head = f"{sanitize_stem(vod_path.stem) or 'vod'}_t"
+    return unlink_matching_entries(
+        get_app_data_dir() / "thumbnails",
+        lambda name: name.startswith(thumb_head) and name.endswith(".jpg"),
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import atexit
+import hashlib
 import json
 import logging
 import os
@@ -10,10 +11,10 @@ import subprocess
 import sys
 import threading
 import time
-import uuid
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from flask import Flask, Response, abort, jsonify, redirect, request, send_file, send_from_directory, stream_with_context, url_for
 
@@ -52,12 +53,12 @@ from app.twitch.jobs import (
 from app.vod.catalog import (
     get_clips_dir,
     get_vod_dirs,
-    get_vod_paths,
     list_sessions,
     list_sessions_for_vod,
+    vod_index,
 )
 from app.vod.scan_files import (
-    get_safe_vod_stem,
+    delete_vod_session_artifacts,
     get_scan_marker_paths,
     list_vod_session_files,
     resolve_bookmarks_context,
@@ -71,7 +72,7 @@ from app.ocr_pipeline.gpu_ocr import (
 from app.twitch.import_runner import run_twitch_import
 from app.vod.paths import resolve_vod_media_filename
 from app.system.config_update import update_config_from_payload
-from app.vod.thumbnails import ensure_vod_thumbnail
+from app.vod.thumbnails import delete_vod_thumbnails, ensure_vod_thumbnail
 from app.system.replay_directory import choose_and_save_replay_dir
 from app.vod.scan_runner import launch_vod_scan_process, terminate_process
 from app.vod.entries import build_vod_entries
@@ -85,10 +86,15 @@ from app.clips.library import (
     resolve_clip_path,
     serialize_clip,
 )
+from app.system.atomic_write import write_text_atomic
+from app.system.job_ids import new_job_uuid
+from app.system.json_provider import OrjsonProvider
 from app.system.backend_logs import get_backend_log_path, open_backend_log, tail_lines
-from app.system.http_cache import set_no_cache_headers
+from app.system.http_cache import is_hashed_asset_path, set_immutable_cache_headers, set_no_cache_headers
+from app.system.static_index import StaticFileIndex
 from app.system.request_guard import load_request_guard_from_env
 from app.vod.download_api import (
+    iter_progress_updates as iter_vod_download_progress,
     progress_response as vod_download_progress_payload,
     start_download_response as vod_download_start_payload,
     tools_check_response as vod_download_tools_payload,
@@ -143,6 +149,7 @@ APP_ROOT = Path(__file__).resolve().parent
 CONFIG_PATH = get_config_path()
 EXIT_RESTART_CODE = 3
 REACT_DIST = get_react_dist()
+react_static_index = StaticFileIndex(REACT_DIST)
 DOWNLOADS_DIR = get_downloads_dir()
 UPDATE_REQUEST_TIMEOUT_SECONDS = 30
 
@@ -154,6 +161,7 @@ DEFAULT_UPDATE_FEED_URL = (
 UPDATE_FEED_URL = os.environ.get("AET_UPDATE_FEED_URL", DEFAULT_UPDATE_FEED_URL)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 _request_guard = load_request_guard_from_env()
 
 
@@ -195,7 +203,7 @@ def create_app() -> Flask:
             ),
             get_notifications=lambda: {
                 "bootstrap": dependency_bootstrap.get_status(),
-                "twitch_jobs": list_twitch_jobs(limit=10) + vod_downloader_as_twitch_jobs(_vod_downloader),
+                "twitch_jobs": [*list_twitch_jobs(limit=10), *vod_downloader_as_twitch_jobs(_vod_downloader)],
                 "patch_notes": load_patch_notes(),
             },
             get_current_app_version=get_current_app_version,
@@ -219,6 +227,7 @@ def create_app() -> Flask:
         vod_download_deps=VodDownloadRouteDeps(
             vod_download_start_response=vod_download_start_response,
             vod_download_progress_response=vod_download_progress_response,
+            vod_download_progress_stream_response=vod_download_progress_stream_response,
             vod_check_tools_response=vod_check_tools_response,
         ),
         twitch_import_deps=TwitchImportRouteDeps(
@@ -294,6 +303,9 @@ def create_app() -> Flask:
 _process_lock = threading.Lock()
 _bookmark_process: Optional[subprocess.Popen] = None
 _vod_ocr_processes: Dict[str, subprocess.Popen] = {}
+# Serializes start/stop/resume per VOD so a slow terminate on one VOD does not hold _process_lock.
+_vod_scan_locks_mutex = threading.Lock()
+_vod_scan_locks: Dict[str, "_VodScanLock"] = {}
 _selected_vod: Optional[Path] = None
 _selected_session: Optional[Path] = None
 
@@ -301,6 +313,32 @@ _selected_session: Optional[Path] = None
 _vod_downloader: Optional[TwitchVODDownloader] = None
 
 
+class _VodScanLock:
+    """Per-VOD lock plus the number of callers holding or waiting on it."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+@contextmanager
+def _vod_scan_lock(vod_key: str) -> Iterator[None]:
+    """Hold the VOD's scan lock; the entry is dropped once no caller needs it."""
+    with _vod_scan_locks_mutex:
+        entry = _vod_scan_locks.get(vod_key)
+        if entry is None:
+            entry = _vod_scan_locks[vod_key] = _VodScanLock()
+        entry.users += 1
+    try:
+        with entry.lock:
+            yield
+    finally:
+        with _vod_scan_locks_mutex:
+            entry.users -= 1
+            if entry.users == 0:
+                _vod_scan_locks.pop(vod_key, None)
+
+
 def cleanup_on_exit() -> None:
     cleanup_vod_scans_on_exit(load_config, _process_lock, _vod_ocr_processes)
 
@@ -314,7 +352,7 @@ def load_config() -> Dict[str, Any]:
 
 
 def save_config(data: Dict[str, Any]) -> None:
-    CONFIG_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    write_text_atomic(CONFIG_PATH, json.dumps(data, indent=2), fsync=True)
 
 
 def get_status() -> Dict[str, Any]:
@@ -682,9 +720,10 @@ def vod_ocr_run_response() -> Any:
 
     config = load_config()
     vod_key = str(resolved_vod_path)
-    with _process_lock:
-        proc = launch_vod_scan_process(CONFIG_PATH, config, vod_key)
-        _vod_ocr_processes[vod_key] = proc
+    with _vod_scan_lock(vod_key):
+        # Launch under _process_lock so exit cleanup never misses a just-started scan.
+        with _process_lock:
+            _vod_ocr_processes[vod_key] = launch_vod_scan_process(CONFIG_PATH, config, vod_key)
     return jsonify({"ok": True})
 
 
@@ -704,13 +743,11 @@ def stop_vod_ocr_response() -> Any:
 
     vod_key = str(resolved_vod_path)
     try:
-        with _process_lock:
-            proc = _vod_ocr_processes.get(vod_key)
+        with _vod_scan_lock(vod_key):
+            with _process_lock:
+                proc = _vod_ocr_processes.pop(vod_key, None)
             if proc is not None:
                 terminate_process(proc, timeout_seconds=5)
-                # Remove from tracking dict
-                if vod_key in _vod_ocr_processes:
-                    del _vod_ocr_processes[vod_key]
         
         # Clean up the .scanning and .paused marker files
         config = load_config()
@@ -778,12 +815,12 @@ def resume_vod_ocr_response() -> Any:
         bookmarks_dir, session_prefix = resolve_bookmarks_context(config)
         _, paused_marker = get_scan_marker_paths(bookmarks_dir, session_prefix, vod_key)
         
-        if not paused_marker.exists():
-            return jsonify({"ok": False, "error": "No paused scan found"}), 400
-        
-        with _process_lock:
-            proc = launch_vod_scan_process(CONFIG_PATH, config, vod_key, resume=True)
-            _vod_ocr_processes[vod_key] = proc
+        with _vod_scan_lock(vod_key):
+            # Checked under the VOD's lock so a concurrent stop cannot clear the marker before launch.
+            if not paused_marker.exists():
+                return jsonify({"ok": False, "error": "No paused scan found"}), 400
+            with _process_lock:
+                _vod_ocr_processes[vod_key] = launch_vod_scan_process(CONFIG_PATH, config, vod_key, resume=True)
         
         return jsonify({"ok": True})
     except Exception as exc:
@@ -916,7 +953,7 @@ def debug_paths_response() -> Any:
 def vods_response() -> Any:
     config = load_config()
     bookmarks_dir, session_prefix = resolve_bookmarks_context(config)
-    vod_paths = get_vod_paths(
+    vod_paths = vod_index.get_vod_paths(
         get_vod_dirs(config), config.get("split", {}).get("extensions", [])
     )
     show_all = request.args.get("all") == "1"
@@ -960,18 +997,11 @@ def delete_vod_response() -> Any:
     try:
         config = load_config()
         bookmarks_dir, session_prefix = resolve_bookmarks_context(config)
-        safe_stem = get_safe_vod_stem(file_path.stem)
-        for file in list_vod_session_files(bookmarks_dir, session_prefix, file_path.stem):
-            file.unlink(missing_ok=True)
-        scanning_marker, paused_marker = get_scan_marker_paths(bookmarks_dir, session_prefix, file_path.stem)
-        scanning_marker.unlink(missing_ok=True)
-        paused_marker.unlink(missing_ok=True)
+        delete_vod_session_artifacts(bookmarks_dir, session_prefix, file_path.stem)
 
         # codeql[py/path-injection]: file_path is constrained to the configured VOD directories by resolve_vod_path (resolve_allowed_path with allowlist check).
         file_path.unlink(missing_ok=True)
-        thumbs_dir = get_app_data_dir() / "thumbnails"
-        for thumb in thumbs_dir.glob(f"{safe_stem}_t*.jpg"):
-            thumb.unlink(missing_ok=True)
+        delete_vod_thumbnails(file_path)
         return jsonify({"ok": True})
     except Exception as exc:
         logging.error("Failed to delete VOD and session artifacts: %s", exc)
@@ -979,25 +1009,33 @@ def delete_vod_response() -> Any:
 
 
 def vods_stream_response() -> Response:
+    show_all = request.args.get("all") == "1"
+    limit_arg = request.args.get("limit")
+    try:
+        limit_value = int(limit_arg) if limit_arg else 10
+    except ValueError:
+        limit_value = 10
+    limit = None if show_all else limit_value
+
     def event_stream() -> Any:
+        last_digest: Optional[bytes] = None
         while True:
             config = load_config()
             bookmarks_dir, session_prefix = resolve_bookmarks_context(config)
-            vod_paths = get_vod_paths(
+            vod_paths = vod_index.get_vod_paths(
                 get_vod_dirs(config), config.get("split", {}).get("extensions", [])
             )
-            show_all = request.args.get("all") == "1"
-            limit_arg = request.args.get("limit")
-            try:
-                limit_value = int(limit_arg) if limit_arg else 10
-            except ValueError:
-                limit_value = 10
-            limit = None if show_all else limit_value
             limited_paths = vod_paths if limit is None else vod_paths[:limit]
             vods = build_vod_entries(limited_paths, bookmarks_dir, session_prefix)
             remaining_count = max(0, len(vod_paths) - len(limited_paths))
-            payload = json.dumps({"vods": vods, "remaining_count": remaining_count})
-            yield f"data: {payload}\n\n"
+            payload = app.json.dumps({"vods": vods, "remaining_count": remaining_count})
+            # Idle ticks only send an SSE comment so clients skip re-parsing an unchanged list.
+            digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+            if digest == last_digest:
+                yield ": keepalive\n\n"
+            else:
+                last_digest = digest
+                yield f"data: {payload}\n\n"
             time.sleep(1)
 
     return Response(
@@ -1026,7 +1064,7 @@ def twitch_import_start_response() -> Any:
     if resolve_tool("yt-dlp", ["yt-dlp.exe"]) is None:
         return jsonify({"ok": False, "error": "yt-dlp not found"}), 400
 
-    job_id = uuid.uuid4().hex
+    job_id = new_job_uuid().hex
     job = {
         "id": job_id,
         "url": url,
@@ -1117,16 +1155,26 @@ def open_backend_log_response() -> Any:
     return jsonify({"ok": True})
 
 
+REACT_STATIC_MAX_AGE_SECONDS = 3600
+
+
+def _serve_react_file(rel_path: str) -> Any:
+    """Send a file from the React build with the cache policy for its kind.
+
+    HTML always revalidates, content-hashed bundles are immutable, and other
+    build files (logo, favicon) get an hour of freshness plus ETag revalidation.
+    """
+    if rel_path.endswith(".html"):
+        return set_no_cache_headers(send_from_directory(REACT_DIST, rel_path))
+    if is_hashed_asset_path(rel_path):
+        return set_immutable_cache_headers(send_from_directory(REACT_DIST, rel_path))
+    return send_from_directory(REACT_DIST, rel_path, max_age=REACT_STATIC_MAX_AGE_SECONDS)
+
+
 def react_logo() -> Any:
-    logo_file = REACT_DIST / "logo.png"
-    if not logo_file.exists() or not logo_file.is_file():
+    if not react_static_index.contains("logo.png"):
         abort(404)
-    response = send_from_directory(REACT_DIST, "logo.png", conditional=False, etag=False, max_age=0)
-    return set_no_cache_headers(
-        response,
-        cache_control="no-store, no-cache, must-revalidate, max-age=0",
-        include_pragma=True,
-    )
+    return _serve_react_file("logo.png")
 
 
 # ==================== Twitch VOD Download Routes ====================
@@ -1148,6 +1196,26 @@ def vod_download_progress_response(job_id: str) -> Any:
     return jsonify(payload), status_code
 
 
+def vod_download_progress_stream_response(job_id: str) -> Any:
+    payload, status_code = vod_download_progress_payload(_vod_downloader, job_id)
+    if status_code != 200:
+        return jsonify(payload), status_code
+    downloader = _vod_downloader
+
+    def event_stream() -> Any:
+        for job in iter_vod_download_progress(downloader, job_id):
+            if job is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"data: {app.json.dumps(job)}\n\n"
+
+    return Response(
+        stream_with_context(event_stream()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 def vod_check_tools_response() -> Any:
     payload, status_code = vod_download_tools_payload(_vod_downloader)
     return jsonify(payload), status_code
@@ -1156,14 +1224,11 @@ def vod_check_tools_response() -> Any:
 # =====================================================================
 
 def react_app(path: str = "") -> Any:
-    if not REACT_DIST.exists():
+    if not react_static_index.root_exists():
         return "React build not found. Run `npm run build` in frontend.", 404
-    target = REACT_DIST / path
-    if path and target.exists() and target.is_file():
-        response = send_from_directory(REACT_DIST, path)
-        return set_no_cache_headers(response)
-    response = send_from_directory(REACT_DIST, "index.html")
-    return set_no_cache_headers(response)
+    if path and react_static_index.contains(path):
+        return _serve_react_file(path)
+    return _serve_react_file("index.html")
 
 
 create_app()
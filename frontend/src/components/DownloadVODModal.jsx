@@ -18,7 +18,9 @@ export default function DownloadVODModal({ isOpen, onClose, onDownloadStart }) {
   const [eta, setEta] = useState('—');
   const [toolsReady, setToolsReady] = useState(null);
   const [downloadComplete, setDownloadComplete] = useState(false);
+  const [isQueued, setIsQueued] = useState(false);
   const pollIntervalRef = React.useRef(null);
+  const progressStreamRef = React.useRef(null);
 
   // Check if tools are ready when modal opens
   useEffect(() => {
@@ -28,12 +30,21 @@ export default function DownloadVODModal({ isOpen, onClose, onDownloadStart }) {
     }
   }, [isOpen]);
 
-  // Cleanup polling interval on unmount
+  const stopProgressUpdates = () => {
+    if (pollIntervalRef.current) {
+      clearInterval(pollIntervalRef.current);
+      pollIntervalRef.current = null;
+    }
+    if (progressStreamRef.current) {
+      progressStreamRef.current.close();
+      progressStreamRef.current = null;
+    }
+  };
+
+  // Cleanup progress stream / polling interval on unmount
   useEffect(() => {
     return () => {
-      if (pollIntervalRef.current) {
-        clearInterval(pollIntervalRef.current);
-      }
+      stopProgressUpdates();
     };
   }, []);
 
@@ -52,7 +63,7 @@ export default function DownloadVODModal({ isOpen, onClose, onDownloadStart }) {
   };
 
   const isValidTwitchUrl = (inputUrl) => {
-    return /https?:\/\/(www\.)?twitch\.tv\/videos\/\d+/.test(inputUrl);
+    return /^https?:\/\/(www\.)?twitch\.tv\/videos\/\d+\/?([?#]\S*)?$/.test(inputUrl.trim());
   };
 
   const handleDownload = async () => {
@@ -101,14 +112,65 @@ export default function DownloadVODModal({ isOpen, onClose, onDownloadStart }) {
         onDownloadStart(data.job_id);
       }
 
-      // Start polling for progress
-      pollProgress(data.job_id);
+      // Subscribe to progress updates
+      streamProgress(data.job_id);
     } catch (err) {
       setError('Error starting download: ' + err.message);
       setIsDownloading(false);
     }
   };
 
+  const applyProgress = (data) => {
+    // The backend runs a limited number of downloads at once; extra jobs wait as "queued".
+    setIsQueued(data.status === 'queued');
+    setProgress(Math.min(data.percentage || 0, 100));
+    setSpeed(data.speed || '—');
+    setEta(data.eta || '—');
+
+    if (data.status === 'completed') {
+      stopProgressUpdates();
+      setIsDownloading(false);
+      setDownloadComplete(true);
+      setProgress(100);
+      // Auto-close after showing completion
+      setTimeout(() => {
+        handleClose();
+      }, 2000);
+    } else if (data.status === 'error') {
+      stopProgressUpdates();
+      setError(data.error || 'Download failed');
+      setIsDownloading(false);
+    }
+  };
+
+  const streamProgress = (jId) => {
+    stopProgressUpdates();
+    if (typeof EventSource === 'undefined') {
+      pollProgress(jId);
+      return;
+    }
+
+    // The server pushes an event whenever yt-dlp reports progress.
+    const source = new EventSource(`/api/vod/progress-stream/${jId}`);
+    progressStreamRef.current = source;
+    source.onmessage = (event) => {
+      try {
+        applyProgress(JSON.parse(event.data));
+      } catch (err) {
+        console.error('Progress stream parse error:', err);
+      }
+    };
+    source.onerror = () => {
+      // Stream closes after a terminal status; otherwise fall back to polling.
+      if (progressStreamRef.current !== source) {
+        return;
+      }
+      source.close();
+      progressStreamRef.current = null;
+      pollProgress(jId);
+    };
+  };
+
   const pollProgress = (jId) => {
     // Clear any existing interval
     if (pollIntervalRef.current) {
@@ -126,25 +188,7 @@ export default function DownloadVODModal({ isOpen, onClose, onDownloadStart }) {
           return;
         }
 
-        // Update progress display
-        setProgress(Math.min(data.percentage || 0, 100));
-        setSpeed(data.speed || '—');
-        setEta(data.eta || '—');
-
-        if (data.status === 'completed') {
-          clearInterval(pollIntervalRef.current);
-          setIsDownloading(false);
-          setDownloadComplete(true);
-          setProgress(100);
-          // Auto-close after showing completion
-          setTimeout(() => {
-            handleClose();
-          }, 2000);
-        } else if (data.status === 'error') {
-          clearInterval(pollIntervalRef.current);
-          setError(data.error || 'Download failed');
-          setIsDownloading(false);
-        }
+        applyProgress(data);
       } catch (err) {
         // Silently ignore polling errors
         console.error('Progress fetch error:', err);
@@ -153,9 +197,7 @@ export default function DownloadVODModal({ isOpen, onClose, onDownloadStart }) {
   };
 
   const handleClose = () => {
-    if (pollIntervalRef.current) {
-      clearInterval(pollIntervalRef.current);
-    }
+    stopProgressUpdates();
     setUrl('');
     setIsDownloading(false);
     setProgress(0);
@@ -164,6 +206,7 @@ export default function DownloadVODModal({ isOpen, onClose, onDownloadStart }) {
     setSpeed('—');
     setEta('—');
     setDownloadComplete(false);
+    setIsQueued(false);
     onClose();
   };
 
@@ -283,7 +326,11 @@ export default function DownloadVODModal({ isOpen, onClose, onDownloadStart }) {
                   fontSize: '13px'
                 }}>
                   <span style={{ color: '#9fb0b7' }}>
-                    {downloadComplete ? 'Download Complete!' : 'Downloading...'}
+                    {downloadComplete
+                      ? 'Download Complete!'
+                      : isQueued
+                        ? 'Queued — waiting for another download to finish...'
+                        : 'Downloading...'}
                   </span>
                   <span style={{
                     color: '#ffb347',
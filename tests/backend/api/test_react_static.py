@@ -0,0 +1,42 @@
+import pytest
+
+import app.webui as webui_module
+from app.system.static_index import StaticFileIndex
+
+
+@pytest.fixture
+def react_dist(monkeypatch, tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<html></html>", encoding="utf-8")
+    (tmp_path / "logo.png").write_bytes(b"png")
+    (tmp_path / "favicon.svg").write_text("<svg/>", encoding="utf-8")
+    (tmp_path / "assets" / "index-AbCdEf12.js").write_text("js", encoding="utf-8")
+    monkeypatch.setattr(webui_module, "REACT_DIST", tmp_path)
+    monkeypatch.setattr(webui_module, "react_static_index", StaticFileIndex(tmp_path, revalidate_seconds=0))
+    return tmp_path
+
+
+def test_logo_supports_etag_revalidation(react_dist) -> None:
+    with webui_module.app.test_client() as client:
+        first = client.get("/logo.png")
+        assert first.status_code == 200
+        assert "max-age=3600" in first.headers["Cache-Control"]
+        etag = first.headers["ETag"]
+
+        second = client.get("/logo.png", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+
+
+def test_react_assets_cache_policy_by_kind(react_dist) -> None:
+    with webui_module.app.test_client() as client:
+        hashed = client.get("/assets/index-AbCdEf12.js")
+        plain = client.get("/favicon.svg")
+        index = client.get("/index.html")
+        fallback = client.get("/vods")
+
+    assert "immutable" in hashed.headers["Cache-Control"]
+    assert "max-age=3600" in plain.headers["Cache-Control"]
+    assert "no-cache" in index.headers["Cache-Control"]
+    assert "no-cache" in fallback.headers["Cache-Control"]
+    for response in (hashed, plain, index, fallback):
+        response.close()
@@ -1,129 +1,76 @@
 """
-Test script for Twitch VOD Download API endpoints
+Tests for the Twitch VOD Download API endpoints
 
 Run with: python -m pytest tests/backend/api/test_vod_api.py
 
 This tests the API without actually downloading VODs (which would be slow).
+The ``client`` fixture lives in tests/backend/conftest.py.
 """
 
 import json
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock
-import sys
-
-# Add app directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-import app.webui as webui_module
-from app.webui import app, _vod_downloader, TwitchVODDownloader
-
-
-def test_api_endpoints():
-    """Test the VOD download API endpoints"""
-
-    # Create test client
-    with app.test_client() as client:
-        trusted_headers = {"Origin": "http://127.0.0.1:5173"}
-        # Initialize the downloader for tests
-        with tempfile.TemporaryDirectory() as tmpdir:
-            webui_module._vod_downloader = TwitchVODDownloader(Path(tmpdir))
-
-            print("\n" + "="*60)
-            print("Testing Twitch VOD Download API")
-            print("="*60)
-
-            # Test 1: Check tools endpoint
-            print("\n[TEST 1] GET /api/vod/check-tools")
-            response = client.get("/api/vod/check-tools")
-            print(f"Status: {response.status_code}")
-            data = response.get_json()
-            print(f"Response: {json.dumps(data, indent=2)}")
-            assert response.status_code == 200
-            assert "yt_dlp_installed" in data
-
-            # Test 2: Invalid URL submission
-            print("\n[TEST 2] POST /api/vod/download (invalid URL)")
-            response = client.post(
-                "/api/vod/download",
-                json={"url": "https://youtube.com/watch?v=123"},
-                content_type="application/json",
-                headers=trusted_headers,
-            )
-            print(f"Status: {response.status_code}")
-            data = response.get_json()
-            print(f"Response: {json.dumps(data, indent=2)}")
-            assert response.status_code == 400
-            assert "Invalid Twitch VOD URL" in data.get("error", "")
-
-            # Test 3: Missing URL
-            print("\n[TEST 3] POST /api/vod/download (missing URL)")
-            response = client.post(
-                "/api/vod/download",
-                json={},
-                content_type="application/json",
-                headers=trusted_headers,
-            )
-            print(f"Status: {response.status_code}")
-            data = response.get_json()
-            print(f"Response: {json.dumps(data, indent=2)}")
-            assert response.status_code == 400
-
-            # Test 4: Valid URL submission (mocked)
-            print("\n[TEST 4] POST /api/vod/download (valid URL)")
-            with patch.object(
-                TwitchVODDownloader, 'check_yt_dlp', return_value=True
-            ):
-                response = client.post(
-                    "/api/vod/download",
-                    json={"url": "https://twitch.tv/videos/123456789"},
-                    content_type="application/json",
-                    headers=trusted_headers,
-                )
-                print(f"Status: {response.status_code}")
-                data = response.get_json()
-                print(f"Response: {json.dumps(data, indent=2)}")
-                assert response.status_code == 202
-                assert "job_id" in data
-                assert data["status"] == "initializing"
-
-                job_id = data["job_id"]
-
-                # Test 5: Get progress for created job
-                print(f"\n[TEST 5] GET /api/vod/progress/{job_id}")
-                response = client.get(f"/api/vod/progress/{job_id}")
-                print(f"Status: {response.status_code}")
-                data = response.get_json()
-                print(f"Response: {json.dumps(data, indent=2)}")
-                assert response.status_code == 200
-                assert data["status"] in [
-                    "initializing",
-                    "fetching_metadata",
-                    "downloading",
-                    "completed",
-                    "error",
-                ]
-
-            # Test 6: Invalid job ID
-            print("\n[TEST 6] GET /api/vod/progress/invalid-job-id")
-            response = client.get("/api/vod/progress/invalid-job-id")
-            print(f"Status: {response.status_code}")
-            data = response.get_json()
-            print(f"Response: {json.dumps(data, indent=2)}")
-            assert response.status_code == 404
-
-            # Test 7: Missing JSON body
-            print("\n[TEST 7] POST /api/vod/download (no JSON)")
-            response = client.post("/api/vod/download", headers=trusted_headers)
-            print(f"Status: {response.status_code}")
-            data = response.get_json()
-            print(f"Response: {json.dumps(data, indent=2)}")
-            assert response.status_code == 400
-
-    print("\n" + "="*60)
-    print("✅ All API tests passed!")
-    print("="*60)
-
-
-if __name__ == "__main__":
-    test_api_endpoints()
+
+from app.webui import TwitchVODDownloader
+
+TRUSTED_HEADERS = {"Origin": "http://127.0.0.1:5173"}
+# Request bodies encoded once at import rather than by the test client on every post.
+INVALID_URL_PAYLOAD = json.dumps({"url": "https://youtube.com/watch?v=123"})
+EMPTY_PAYLOAD = json.dumps({})
+VALID_URL_PAYLOAD = json.dumps({"url": "https://twitch.tv/videos/123456789"})
+
+
+def _post_download(client, payload):
+    return client.post(
+        "/api/vod/download",
+        data=payload,
+        content_type="application/json",
+        headers=TRUSTED_HEADERS,
+    )
+
+
+def test_check_tools(client):
+    response = client.get("/api/vod/check-tools")
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert "yt_dlp_installed" in response.get_json()
+
+
+def test_download_rejects_invalid_url(client):
+    response = _post_download(client, INVALID_URL_PAYLOAD)
+    assert response.status_code == 400, response.get_data(as_text=True)
+    assert "Invalid Twitch VOD URL" in response.get_json().get("error", "")
+
+
+def test_download_requires_url(client):
+    response = _post_download(client, EMPTY_PAYLOAD)
+    assert response.status_code == 400, response.get_data(as_text=True)
+
+
+def test_download_requires_json_body(client):
+    response = client.post("/api/vod/download", headers=TRUSTED_HEADERS)
+    assert response.status_code == 400, response.get_data(as_text=True)
+
+
+def test_download_valid_url_creates_job_with_progress(client, vod_downloader, monkeypatch):
+    monkeypatch.setattr(TwitchVODDownloader, "check_yt_dlp", lambda self: True)
+    response = _post_download(client, VALID_URL_PAYLOAD)
+    data = response.get_json()
+    assert response.status_code == 202, response.get_data(as_text=True)
+    assert "job_id" in data
+    assert data["status"] == "initializing"
+
+    assert vod_downloader.get_progress(data["job_id"]) is not None
+
+    response = client.get(f"/api/vod/progress/{data['job_id']}")
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.get_json()["status"] in [
+        "queued",
+        "initializing",
+        "fetching_metadata",
+        "downloading",
+        "completed",
+        "error",
+    ]
+
+
+def test_progress_unknown_job_returns_404(client):
+    response = client.get("/api/vod/progress/invalid-job-id")
+    assert response.status_code == 404, response.get_data(as_text=True)
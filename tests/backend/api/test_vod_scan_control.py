@@ -0,0 +1,129 @@
+import threading
+import time
+
+import app.webui as webui_module
+
+TRUSTED_HEADERS = {"Origin": "http://127.0.0.1:5173"}
+
+
+def test_stop_vod_ocr_terminates_without_holding_global_process_lock(monkeypatch, tmp_path):
+    vod_file = tmp_path / "match.mp4"
+    vod_file.write_bytes(b"vod")
+    bookmarks_dir = tmp_path / "bookmarks"
+    bookmarks_dir.mkdir()
+    config = {
+        "replay": {"directory": str(tmp_path)},
+        "bookmarks": {"directory": str(bookmarks_dir), "session_prefix": "session"},
+    }
+    monkeypatch.setattr(webui_module, "load_config", lambda: config)
+
+    vod_key = str(vod_file.resolve())
+    proc = object()
+    monkeypatch.setitem(webui_module._vod_ocr_processes, vod_key, proc)
+    terminated = []
+
+    def fake_terminate(target, *, timeout_seconds):
+        assert not webui_module._process_lock.locked()
+        assert webui_module._vod_scan_locks[vod_key].lock.locked()
+        terminated.append(target)
+
+    monkeypatch.setattr(webui_module, "terminate_process", fake_terminate)
+
+    with webui_module.app.test_client() as client:
+        response = client.post("/api/stop-vod-ocr", json={"vod_path": str(vod_file)}, headers=TRUSTED_HEADERS)
+
+    assert response.status_code == 200
+    assert terminated == [proc]
+    assert vod_key not in webui_module._vod_ocr_processes
+    assert vod_key not in webui_module._vod_scan_locks
+
+
+def test_run_vod_ocr_registers_process_while_launching(monkeypatch, tmp_path):
+    vod_file = tmp_path / "match.mp4"
+    vod_file.write_bytes(b"vod")
+    config = {"replay": {"directory": str(tmp_path)}}
+    monkeypatch.setattr(webui_module, "load_config", lambda: config)
+    monkeypatch.setattr(webui_module, "_vod_ocr_processes", {})
+
+    proc = object()
+
+    def fake_launch(config_path, cfg, vod_key, resume=False):
+        # Exit cleanup takes _process_lock, so it cannot run between launch and registration.
+        assert webui_module._process_lock.locked()
+        return proc
+
+    monkeypatch.setattr(webui_module, "launch_vod_scan_process", fake_launch)
+
+    with webui_module.app.test_client() as client:
+        response = client.post("/api/vod-ocr", json={"vod_path": str(vod_file)}, headers=TRUSTED_HEADERS)
+
+    vod_key = str(vod_file.resolve())
+    assert response.status_code == 200
+    assert webui_module._vod_ocr_processes == {vod_key: proc}
+    assert vod_key not in webui_module._vod_scan_locks
+
+
+def test_vod_scan_lock_serializes_callers_and_is_dropped_when_idle():
+    vod_key = "contended.mp4"
+    first_inside = threading.Event()
+    release_first = threading.Event()
+    second_inside = threading.Event()
+    order = []
+
+    def first():
+        with webui_module._vod_scan_lock(vod_key):
+            order.append("first")
+            first_inside.set()
+            release_first.wait(5)
+
+    def second():
+        first_inside.wait(5)
+        with webui_module._vod_scan_lock(vod_key):
+            order.append("second")
+            second_inside.set()
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    assert first_inside.wait(5)
+    deadline = time.monotonic() + 5
+    while webui_module._vod_scan_locks[vod_key].users < 2:
+        assert time.monotonic() < deadline, "second caller never queued on the lock"
+        time.sleep(0.001)
+    assert not second_inside.is_set()
+
+    release_first.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert order == ["first", "second"]
+    assert vod_key not in webui_module._vod_scan_locks
+
+
+def test_resume_vod_ocr_checks_paused_marker_under_vod_lock(monkeypatch, tmp_path):
+    vod_file = tmp_path / "match.mp4"
+    vod_file.write_bytes(b"vod")
+    bookmarks_dir = tmp_path / "bookmarks"
+    bookmarks_dir.mkdir()
+    config = {
+        "replay": {"directory": str(tmp_path)},
+        "bookmarks": {"directory": str(bookmarks_dir), "session_prefix": "session"},
+    }
+    monkeypatch.setattr(webui_module, "load_config", lambda: config)
+    monkeypatch.setattr(webui_module, "_vod_ocr_processes", {})
+    vod_key = str(vod_file.resolve())
+    checks = []
+
+    class Marker:
+        def exists(self):
+            checks.append(webui_module._vod_scan_locks[vod_key].lock.locked())
+            return False
+
+    monkeypatch.setattr(webui_module, "get_scan_marker_paths", lambda *_args: (Marker(), Marker()))
+
+    with webui_module.app.test_client() as client:
+        response = client.post("/api/resume-vod-ocr", json={"vod_path": str(vod_file)}, headers=TRUSTED_HEADERS)
+
+    assert response.status_code == 400
+    assert checks == [True]
+    assert webui_module._vod_ocr_processes == {}
@@ -0,0 +1,17 @@
+import app.webui as webui_module
+
+
+def test_vods_stream_sends_keepalive_when_payload_is_unchanged(monkeypatch, tmp_path):
+    monkeypatch.setattr(webui_module, "load_config", lambda: {"replay": {"directory": str(tmp_path)}})
+    monkeypatch.setattr(webui_module, "build_vod_entries", lambda paths, *_args: [])
+    monkeypatch.setattr(webui_module.time, "sleep", lambda _seconds: None)
+
+    with webui_module.app.test_client() as client:
+        response = client.get("/api/vods/stream", buffered=False)
+        chunks = response.iter_encoded()
+        first = next(chunks).decode("utf-8")
+        second = next(chunks).decode("utf-8")
+        response.close()
+
+    assert first.startswith("data: ")
+    assert second == ": keepalive\n\n"
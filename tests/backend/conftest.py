@@ -0,0 +1,30 @@
+import pytest
+
+import app.webui as webui_module
+from app.vod.download import TwitchVODDownloader
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _stub_yt_dlp_probe():
+    """Report yt-dlp as working without running ``yt-dlp --version`` in any test."""
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(TwitchVODDownloader, "_probe_yt_dlp", staticmethod(lambda yt_dlp_path: True))
+        yield
+
+
+@pytest.fixture(scope="session")
+def vod_downloader(tmp_path_factory):
+    """Downloader writing to a session temp dir; the API client routes through it."""
+    return TwitchVODDownloader(tmp_path_factory.mktemp("vod", numbered=False))
+
+
+@pytest.fixture(scope="session")
+def client(vod_downloader):
+    """One Flask test client per session, with ``vod_downloader`` installed on app.webui."""
+    previous = webui_module._vod_downloader
+    webui_module._vod_downloader = vod_downloader
+    try:
+        with webui_module.app.test_client() as test_client:
+            yield test_client
+    finally:
+        webui_module._vod_downloader = previous
@@ -4,87 +4,121 @@ Tests for Twitch VOD Download functionality
 Run with: python -m pytest tests/backend/integration/test_vod_download.py -v
 """
 
+import uuid
+from collections import OrderedDict
+
 import pytest
-import tempfile
-from pathlib import Path
 from app.vod.download import TwitchVODDownloader
 
 
+# Resolved once at collection (a PATH/tools-dir lookup, no subprocess) to pick the applicable test.
+YT_DLP_PATH = TwitchVODDownloader._resolve_yt_dlp_path()
+
+
 class TestTwitchVODDownloader:
     """Test suite for TwitchVODDownloader class"""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    @pytest.fixture(scope="module")
+    def temp_dir(self, tmp_path_factory):
+        """Create a temporary directory shared by the module's tests"""
+        return tmp_path_factory.mktemp("dl", numbered=False)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def downloader(self, temp_dir):
-        """Create a downloader instance with temp directory"""
+        """Create one downloader instance; tests that add jobs remove them again"""
         return TwitchVODDownloader(temp_dir)
 
     def test_initialization(self, downloader, temp_dir):
         """Test that downloader initializes correctly"""
         assert downloader.output_dir == temp_dir
-        assert isinstance(downloader.jobs, dict)
+        assert isinstance(downloader.jobs, OrderedDict)
         assert len(downloader.jobs) == 0
 
-    def test_url_validation_valid(self, downloader):
-        """Test URL validation with valid Twitch URLs"""
-        valid_urls = [
+    @pytest.mark.parametrize(
+        "url",
+        [
             "https://twitch.tv/videos/123456789",
             "https://www.twitch.tv/videos/987654321",
             "http://twitch.tv/videos/111111111",
             "http://www.twitch.tv/videos/222222222",
-        ]
-        for url in valid_urls:
-            assert downloader.validate_url(url), f"Should accept {url}"
+        ],
+    )
+    def test_url_validation_valid(self, downloader, url):
+        """Test URL validation with valid Twitch URLs"""
+        assert downloader.validate_url(url)
 
-    def test_url_validation_invalid(self, downloader):
-        """Test URL validation with invalid Twitch URLs"""
-        invalid_urls = [
+    @pytest.mark.parametrize(
+        "url",
+        [
             "",
             "https://youtube.com/watch?v=123",
             "https://twitch.tv/channels/user",
             "https://twitch.tv/user",
             "not a url",
             "https://example.com",
-        ]
-        for url in invalid_urls:
-            assert not downloader.validate_url(url), f"Should reject {url}"
-
-    def test_filename_generation(self, downloader):
+        ],
+    )
+    def test_url_validation_invalid(self, downloader, url):
+        """Test URL validation with invalid Twitch URLs"""
+        assert not downloader.validate_url(url)
+
+    @pytest.mark.parametrize(
+        "metadata,expected",
+        [
+            ({"streamer": "TimTheTatman", "date": "2026-02-26"}, "TimTheTatman_2026-02-26.mp4"),
+            ({}, "unknown_unknown.mp4"),
+        ],
+    )
+    def test_filename_generation(self, downloader, metadata, expected):
         """Test filename generation from metadata"""
-        metadata = {
-            "streamer": "TimTheTatman",
-            "date": "2026-02-26",
-        }
-        filename = downloader._get_filename(metadata)
-        assert filename == "TimTheTatman_2026-02-26.mp4"
-
-    def test_sanitize_filename(self, downloader):
-        """Test filename sanitization"""
-        test_cases = [
+        assert downloader._get_filename(metadata) == expected
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
             ("Normal Name", "Normal Name"),
             ("Name<With>Invalid:Chars", "Name_With_Invalid_Chars"),
             ("Name|With\"Quotes", "Name_With_Quotes"),
             ("...StartWithDots...", "StartWithDots"),
             ("   Leading Spaces", "Leading Spaces"),
-        ]
-        for input_name, expected in test_cases:
-            result = downloader._sanitize_filename(input_name)
-            assert result == expected or len(result) <= 200
-
-    def test_yt_dlp_detection(self, downloader):
-        """Test yt-dlp installation detection"""
-        # This will depend on whether yt-dlp is installed in the test environment
-        result = downloader.check_yt_dlp()
-        assert isinstance(result, bool)
-
-    def test_job_creation(self, downloader):
+        ],
+    )
+    def test_sanitize_filename(self, downloader, raw, expected):
+        """Test filename sanitization"""
+        assert downloader._sanitize_filename(raw) == expected
+
+    def test_sanitize_length_bound(self, downloader):
+        """Test that sanitized names are capped at 200 characters"""
+        assert len(downloader._sanitize_filename("a" * 500)) == 200
+
+    @pytest.mark.skipif(YT_DLP_PATH is None, reason="yt-dlp not installed")
+    def test_yt_dlp_detected(self, downloader, monkeypatch):
+        """Test that an installed yt-dlp is probed once and reported available"""
+        calls = []
+        monkeypatch.setattr(downloader, "_probe_yt_dlp", lambda path: calls.append(path) or True)
+        monkeypatch.setattr(downloader, "_yt_dlp_check", None)
+
+        assert downloader.check_yt_dlp() is True
+        assert downloader.check_yt_dlp() is True
+        assert calls == [YT_DLP_PATH]
+
+    @pytest.mark.skipif(YT_DLP_PATH is not None, reason="yt-dlp is installed")
+    def test_yt_dlp_missing(self, downloader, monkeypatch):
+        """Test that a missing yt-dlp is reported without probing"""
+        calls = []
+        monkeypatch.setattr(downloader, "_probe_yt_dlp", lambda path: calls.append(path) or True)
+        monkeypatch.setattr(downloader, "_yt_dlp_check", None)
+
+        assert downloader.check_yt_dlp() is False
+        assert calls == []
+
+    def test_job_creation(self, downloader, monkeypatch, request):
         """Test that jobs are created correctly"""
-        job_id = "test-job-123"
+        # Unique per run so parallel workers sharing a downloader never collide.
+        job_id = f"test-job-{uuid.uuid4()}"
+        # Keep the background thread from running yt-dlp against the shared downloader.
+        monkeypatch.setattr(downloader, "_download_worker", lambda *args: None)
+        request.addfinalizer(lambda: downloader.jobs.pop(job_id, None))
         downloader.start_download("https://twitch.tv/videos/123456789", job_id)
 
         # Job should exist
@@ -98,7 +132,3 @@ class TestTwitchVODDownloader:
         """Test getting a job that doesn't exist"""
         result = downloader.get_progress("nonexistent-job")
         assert result is None
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -170,3 +170,18 @@ def test_rate_state_evicts_idle_keys() -> None:
     guard._evict_rate_state(guard._rate_state[only_key][-1] + 3.0)
 
     assert not guard._rate_state
+
+
+def test_rate_limit_applies_to_progress_polls_per_job() -> None:
+    guard = _guard(poll_limit_count=2, poll_limit_window_seconds=60)
+
+    assert guard.validate(_request("/api/vod/progress/job-a")) == (True, "", 200)
+    assert guard.validate(_request("/api/vod/progress/job-a")) == (True, "", 200)
+    blocked = guard.validate(_request("/api/vod/progress/job-a"))
+    assert blocked[0] is False
+    assert blocked[2] == 429
+
+    assert guard.validate(_request("/api/vod/progress/job-b")) == (True, "", 200)
+    assert guard.validate(_request("/api/vod/progress/job-a", remote_addr="10.0.0.2")) == (True, "", 200)
+    assert guard.validate(_request("/api/vods")) == (True, "", 200)
+    assert not any("/api/vods" in key for key in guard._rate_state)
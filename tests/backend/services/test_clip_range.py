@@ -208,3 +208,51 @@ def test_clip_range_empty_output_dir_keeps_existing_clips_parent(
     output_path = Path(payload["clip_path"])
     assert output_path.parent == clips_dir
     assert not (clips_dir / "clips").exists()
+
+
+def test_clip_range_counts_events_from_cached_session(tmp_path: Path, monkeypatch) -> None:
+    replay_dir = tmp_path / "replays"
+    bookmarks_dir = tmp_path / "bookmarks"
+    replay_dir.mkdir(parents=True, exist_ok=True)
+    bookmarks_dir.mkdir(parents=True, exist_ok=True)
+    vod_file = replay_dir / "match.mp4"
+    vod_file.write_bytes(b"vod")
+    session_file = bookmarks_dir / "session_match_20240101_120000.jsonl"
+    session_file.write_text(
+        "\n".join(
+            [
+                '{"seconds_since_start": 9.0, "event": "kill"}',
+                '{"seconds_since_start": 2.0, "event": "assist"}',
+                '{"seconds_since_start": 0.5, "event": "kill"}',
+                '{"seconds_since_start": 3.0, "event": "knocked"}',
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    config = _base_config(replay_dir, bookmarks_dir)
+    config["split"]["encode_counts"] = True
+
+    loads = []
+    real_load = clip_range.load_bookmarks
+
+    def counting_load(path: Path):
+        loads.append(path)
+        return real_load(path)
+
+    def fake_run_ffmpeg(input_file: Path, output_file: Path, start: float, duration: float) -> None:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_bytes(b"clip")
+
+    clip_range._load_sorted_bookmarks.cache_clear()
+    monkeypatch.setattr(clip_range, "load_bookmarks", counting_load)
+    monkeypatch.setattr(clip_range, "run_ffmpeg", fake_run_ffmpeg)
+
+    payload, status = clip_range.create_clip_range_payload(config, str(vod_file), 1.0, 3.0)
+    assert status == 200
+    assert payload["clip_path"].endswith("_k1_a1_d0.mp4")
+
+    payload, status = clip_range.create_clip_range_payload(config, str(vod_file), 8.0, 10.0)
+    assert status == 200
+    assert payload["clip_path"].endswith("_k1_a0_d0.mp4")
+    assert len(loads) == 1
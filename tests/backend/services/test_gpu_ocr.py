@@ -0,0 +1,73 @@
+import os
+from collections import namedtuple
+
+from app.ocr_pipeline import gpu_ocr
+
+_Usage = namedtuple("_Usage", "total used free")
+
+
+def test_check_install_disk_space_is_memoized_per_drive(monkeypatch) -> None:
+    calls = []
+    clock = [100.0]
+    monkeypatch.setattr(gpu_ocr, "_disk_space_cache", {})
+    monkeypatch.setattr(gpu_ocr.time, "monotonic", lambda: clock[0])
+
+    def fake_disk_usage(root):
+        calls.append(root)
+        return _Usage(0, 0, 1024 ** 3)
+
+    monkeypatch.setattr(gpu_ocr.shutil, "disk_usage", fake_disk_usage)
+
+    ok, message = gpu_ocr.check_install_disk_space("")
+    assert ok is False
+    assert "1.0 GB free" in message
+    assert calls and calls[0].endswith(os.sep)
+
+    gpu_ocr.check_install_disk_space("")
+    assert len(calls) == 1
+
+    clock[0] += gpu_ocr.DISK_SPACE_CACHE_TTL_SECONDS + 1
+    gpu_ocr.check_install_disk_space("")
+    assert len(calls) == 2
+
+
+def test_check_install_disk_space_allows_install_when_probe_fails(monkeypatch) -> None:
+    monkeypatch.setattr(gpu_ocr, "_disk_space_cache", {})
+
+    def failing_disk_usage(root):
+        raise OSError("unavailable")
+
+    monkeypatch.setattr(gpu_ocr.shutil, "disk_usage", failing_disk_usage)
+    assert gpu_ocr.check_install_disk_space("") == (True, "")
+
+
+def test_parse_py_launcher_listing_skips_store_stubs() -> None:
+    output = "\n".join(
+        [
+            " -V:3.13 *        C:\\Python313\\python.exe",
+            " -V:3.12          C:\\Python312\\python.exe",
+            " -3.11-64         C:\\Python311\\python.exe",
+            " -V:3.10          C:\\Users\\me\\AppData\\Local\\Microsoft\\WindowsApps\\python.exe",
+            "Installed Pythons found by py Launcher for Windows",
+        ]
+    )
+
+    installs = gpu_ocr.parse_py_launcher_listing(output)
+
+    assert installs == [
+        ((3, 13), "C:\\Python313\\python.exe"),
+        ((3, 12), "C:\\Python312\\python.exe"),
+        ((3, 11), "C:\\Python311\\python.exe"),
+    ]
+    assert gpu_ocr._pick_launcher_python(installs) == "C:\\Python312\\python.exe"
+    assert gpu_ocr._pick_launcher_python(installs[2:]) == "C:\\Python311\\python.exe"
+
+
+def test_find_install_python_uses_current_interpreter_when_not_frozen(monkeypatch) -> None:
+    monkeypatch.setattr(gpu_ocr, "is_frozen", lambda: False)
+
+    def fail_run(*_args, **_kwargs):
+        raise AssertionError("no subprocess probe expected")
+
+    monkeypatch.setattr(gpu_ocr.subprocess, "run", fail_run)
+    assert gpu_ocr.find_install_python() == ([gpu_ocr.sys.executable], gpu_ocr.sys.executable)
@@ -0,0 +1,54 @@
+from app.twitch import import_runner
+
+
+class _FakeProc:
+    def __init__(self, lines):
+        self.stdout = iter(lines)
+
+    def wait(self) -> int:
+        return 1
+
+
+def test_run_twitch_import_throttles_progress_writes(monkeypatch) -> None:
+    writes = []
+    clock = [10.0]
+    lines = [f"download:{pct}%|1MiB/s|00:10\n" for pct in range(1, 21)]
+
+    def fake_popen(*_args, **_kwargs):
+        def advancing_lines():
+            for line in lines:
+                clock[0] += 0.1
+                yield line
+
+        return _FakeProc(advancing_lines())
+
+    monkeypatch.setattr(import_runner, "read_twitch_job", lambda _job_id: None)
+    monkeypatch.setattr(import_runner, "write_twitch_job", lambda _job_id, job: writes.append(dict(job)))
+    monkeypatch.setattr(import_runner, "resolve_tool", lambda *_args: "yt-dlp")
+    monkeypatch.setattr(import_runner.subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(import_runner.time, "monotonic", lambda: clock[0])
+
+    import_runner.run_twitch_import("job", "https://www.twitch.tv/videos/1")
+
+    progress_writes = [job for job in writes if job.get("message") == "Downloading"]
+    assert 0 < len(progress_writes) <= 5
+    assert writes[-1]["status"] == "failed"
+
+
+def test_run_twitch_import_skips_locked_progress_writes(monkeypatch) -> None:
+    writes = []
+    lines = [f"download:{pct}%|1MiB/s|00:10\n" for pct in range(1, 4)]
+
+    def flaky_write(_job_id, job):
+        if job.get("message") == "Downloading":
+            raise PermissionError("file in use")
+        writes.append(dict(job))
+
+    monkeypatch.setattr(import_runner, "read_twitch_job", lambda _job_id: None)
+    monkeypatch.setattr(import_runner, "write_twitch_job", flaky_write)
+    monkeypatch.setattr(import_runner, "resolve_tool", lambda *_args: "yt-dlp")
+    monkeypatch.setattr(import_runner.subprocess, "Popen", lambda *_args, **_kwargs: _FakeProc(lines))
+
+    import_runner.run_twitch_import("job", "https://www.twitch.tv/videos/1")
+
+    assert writes[-1]["status"] == "failed"
@@ -1,5 +1,7 @@
 import json
+import os
 import time
+from collections import OrderedDict
 
 from app.twitch import jobs
 
@@ -38,3 +40,58 @@ def test_prune_stale_twitch_jobs_removes_old_active_jobs(tmp_path, monkeypatch)
     assert not old_active.exists()
     assert old_terminal.exists()
     assert fresh_active.exists()
+
+
+def test_twitch_job_reads_are_cached_until_rewritten(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(jobs, "DOWNLOADS_DIR", tmp_path)
+    monkeypatch.setattr(jobs, "_job_cache", OrderedDict())
+    jobs.write_twitch_job("abc", {"id": "abc", "status": "queued"})
+
+    loads = []
+    real_parse = jobs.loads_json
+
+    def counting_parse(raw):
+        loads.append(raw)
+        return real_parse(raw)
+
+    monkeypatch.setattr(jobs, "loads_json", counting_parse)
+
+    first = jobs.read_twitch_job("abc")
+    first["status"] = "mutated"
+    assert jobs.read_twitch_job("abc") == {"id": "abc", "status": "queued"}
+    assert jobs.list_twitch_jobs() == [{"id": "abc", "status": "queued"}]
+    assert len(loads) == 1
+
+    jobs.write_twitch_job("abc", {"id": "abc", "status": "downloading"})
+    assert jobs.read_twitch_job("abc")["status"] == "downloading"
+    assert len(loads) == 2
+    assert jobs.read_twitch_job("missing") is None
+
+
+def test_twitch_job_files_round_trip_as_indented_json(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(jobs, "DOWNLOADS_DIR", tmp_path)
+    monkeypatch.setattr(jobs, "_job_cache", OrderedDict())
+    payload = {"id": "xyz", "status": "downloading", "progress": 42.5, "title": "Caf\u00e9 run"}
+
+    jobs.write_twitch_job("xyz", payload)
+
+    raw = (tmp_path / "job_xyz.json").read_text(encoding="utf-8")
+    assert json.loads(raw) == payload
+    assert raw.startswith("{\n  ")
+    assert jobs.read_twitch_job("xyz") == payload
+
+
+def test_twitch_job_cache_is_bounded_and_forgets_pruned_files(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(jobs, "DOWNLOADS_DIR", tmp_path)
+    monkeypatch.setattr(jobs, "_job_cache", OrderedDict())
+    monkeypatch.setattr(jobs, "MAX_CACHED_JOB_FILES", 2)
+    for job_id in ("a", "b", "c"):
+        jobs.write_twitch_job(job_id, {"id": job_id, "status": "queued"})
+        jobs.read_twitch_job(job_id)
+
+    assert list(jobs._job_cache) == [str(tmp_path / "job_b.json"), str(tmp_path / "job_c.json")]
+
+    for job_id in ("a", "b", "c"):
+        os.utime(tmp_path / f"job_{job_id}.json", (1_000, 1_000))
+    assert jobs.prune_stale_twitch_jobs(max_age_seconds=60) == 3
+    assert jobs._job_cache == OrderedDict()
@@ -0,0 +1,121 @@
+import os
+from pathlib import Path
+
+from app.vod import catalog
+
+
+def _write(path: Path, mtime: float) -> Path:
+    path.write_bytes(b"vod")
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_get_vod_paths_filters_and_sorts_newest_first(tmp_path: Path) -> None:
+    older = _write(tmp_path / "older.mp4", 1_000)
+    newer = _write(tmp_path / "newer.mp4", 2_000)
+    _write(tmp_path / "partial.mp4.part", 3_000)
+    _write(tmp_path / "notes.txt", 3_000)
+    (tmp_path / "clips").mkdir()
+
+    assert catalog.get_vod_paths([tmp_path], [".mp4"]) == [newer, older]
+
+
+def test_vod_index_reuses_listing_until_directory_changes(tmp_path: Path, monkeypatch) -> None:
+    first = _write(tmp_path / "first.mp4", 1_000)
+    index = catalog.VodIndex()
+    scans = []
+    real_scan = catalog._scan_vod_directory
+
+    def counting_scan(directory: Path):
+        scans.append(directory)
+        return real_scan(directory)
+
+    monkeypatch.setattr(catalog, "_scan_vod_directory", counting_scan)
+
+    assert index.get_vod_paths([tmp_path], [".mp4"]) == [first]
+    assert index.get_vod_paths([tmp_path], [".mp4"]) == [first]
+    assert len(scans) == 1
+
+    second = _write(tmp_path / "second.mp4", 2_000)
+    dir_stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns + 1_000_000))
+
+    assert index.get_vod_paths([tmp_path], [".mp4"]) == [second, first]
+    assert len(scans) == 2
+
+
+def test_vod_index_skips_missing_directories(tmp_path: Path) -> None:
+    index = catalog.VodIndex()
+    assert index.get_vod_paths([tmp_path / "missing"], [".mp4"]) == []
+
+
+def test_get_vod_paths_merges_multiple_directories(tmp_path: Path) -> None:
+    first_dir = tmp_path / "recordings"
+    second_dir = tmp_path / "downloads"
+    first_dir.mkdir()
+    second_dir.mkdir()
+    oldest = _write(first_dir / "a.mp4", 1_000)
+    newest = _write(second_dir / "b.mp4", 3_000)
+    middle = _write(first_dir / "c.mp4", 2_000)
+
+    directories = [first_dir, second_dir, tmp_path / "missing"]
+    assert catalog.get_vod_paths(directories, [".mp4"]) == [newest, middle, oldest]
+    assert catalog.VodIndex().get_vod_paths(directories, [".mp4"]) == [newest, middle, oldest]
+
+
+def test_list_sessions_for_vod_filters_by_prefix_and_sorts_newest_first(tmp_path: Path) -> None:
+    older = _write(tmp_path / "session_My_VOD_20240101_120000.csv", 1_000)
+    newer = _write(tmp_path / "session_My_VOD_20240102_120000.jsonl", 2_000)
+    _write(tmp_path / "session_Other_20240103_120000.csv", 3_000)
+    _write(tmp_path / "session_My_VOD.scanning", 3_000)
+
+    sessions = catalog.list_sessions_for_vod(tmp_path, "session", "My VOD")
+
+    assert [entry["path"] for entry in sessions] == [str(newer), str(older)]
+    assert sessions[0]["size"] == 3
+    assert sessions[0]["display_name"]
+    assert catalog.list_sessions_for_vod(tmp_path, "session", "My VOD", limit=1)[0]["path"] == str(newer)
+    assert catalog.list_sessions_for_vod(tmp_path / "missing", "session", "My VOD") == []
+    assert len(catalog.list_sessions(tmp_path)) == 3
+
+
+def test_vod_index_revalidates_with_one_stat_per_directory(tmp_path: Path, monkeypatch) -> None:
+    first = _write(tmp_path / "first.mp4", 1_000)
+    second = _write(tmp_path / "second.mp4", 2_000)
+    index = catalog.VodIndex()
+    assert index.get_vod_paths([tmp_path], [".mp4"]) == [second, first]
+
+    stats = []
+    real_stat = Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        stats.append(self)
+        return real_stat(self, *args, **kwargs)
+
+    def fail_scan(directory: Path):
+        raise AssertionError("unchanged directory was rescanned")
+
+    monkeypatch.setattr(Path, "stat", counting_stat)
+    monkeypatch.setattr(catalog, "_scan_vod_directory", fail_scan)
+
+    assert index.get_vod_paths([tmp_path], [".mp4"]) == [second, first]
+    assert stats == [tmp_path]
+
+
+def test_vod_index_evicts_missing_and_least_recent_directories(tmp_path: Path) -> None:
+    dirs = []
+    for name in ("a", "b", "c"):
+        directory = tmp_path / name
+        directory.mkdir()
+        _write(directory / f"{name}.mp4", 1_000)
+        dirs.append(directory)
+    index = catalog.VodIndex(max_directories=2)
+
+    for directory in dirs:
+        index.get_vod_paths([directory], [".mp4"])
+    assert list(index._dirs) == [str(dirs[1]), str(dirs[2])]
+
+    (dirs[2] / "c.mp4").unlink()
+    dirs[2].rmdir()
+    assert index.get_vod_paths([dirs[2]], [".mp4"]) == []
+    assert list(index._dirs) == [str(dirs[1])]
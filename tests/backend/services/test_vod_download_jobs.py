@@ -0,0 +1,212 @@
+import gc
+import threading
+import time
+import weakref
+
+from app.twitch import vod_download_jobs
+from app.vod import download
+from app.vod.download import TwitchVODDownloader
+from app.vod.download_api import iter_progress_updates
+
+
+def test_vod_downloader_jobs_are_reused_until_revision_changes(tmp_path, monkeypatch) -> None:
+    downloader = TwitchVODDownloader(output_dir=str(tmp_path))
+    downloader.jobs["job-1"] = {"url": "https://www.twitch.tv/videos/1", "status": "initializing", "percentage": 0}
+
+    calls = []
+    real_list_jobs = downloader.list_jobs
+
+    def counting_list_jobs():
+        calls.append(1)
+        return real_list_jobs()
+
+    monkeypatch.setattr(downloader, "list_jobs", counting_list_jobs)
+
+    first = vod_download_jobs.vod_downloader_as_twitch_jobs(downloader)
+    second = vod_download_jobs.vod_downloader_as_twitch_jobs(downloader)
+    assert first == second
+    assert first[0]["status"] == "downloading"
+    assert len(calls) == 1
+
+    downloader._update_job("job-1", status="error", error="boom")
+    updated = vod_download_jobs.vod_downloader_as_twitch_jobs(downloader)
+    assert len(calls) == 2
+    assert updated[0]["status"] == "failed"
+    assert updated[0]["message"] == "boom"
+
+
+def _wait_for_status(downloader, job_id, status, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    revision = -1
+    while time.monotonic() < deadline:
+        revision, job = downloader.wait_for_job_change(job_id, revision, deadline - time.monotonic())
+        if job is not None and job["status"] == status:
+            return job
+    raise AssertionError(f"{job_id} never reached {status!r}")
+
+
+def test_downloader_limits_concurrent_downloads(tmp_path, monkeypatch) -> None:
+    downloader = TwitchVODDownloader(output_dir=str(tmp_path), max_concurrent_downloads=1)
+    release = threading.Event()
+    started = {"job-1": threading.Event(), "job-2": threading.Event()}
+
+    def blocking_worker(job_id, url, progress_callback=None):
+        started[job_id].set()
+        release.wait(5)
+
+    monkeypatch.setattr(downloader, "_download_worker", blocking_worker)
+
+    downloader.start_download("https://www.twitch.tv/videos/1", "job-1")
+    assert started["job-1"].wait(5)
+    downloader.start_download("https://www.twitch.tv/videos/2", "job-2")
+
+    _wait_for_status(downloader, "job-2", "queued")
+    assert not started["job-2"].is_set()
+    assert vod_download_jobs.vod_downloader_as_twitch_jobs(downloader)[1]["status"] == "queued"
+
+    release.set()
+    assert started["job-2"].wait(5)
+    assert downloader.get_progress("job-2")["status"] == "initializing"
+
+
+def test_check_yt_dlp_reuses_result_within_ttl(tmp_path, monkeypatch) -> None:
+    downloader = TwitchVODDownloader(output_dir=str(tmp_path))
+    clock = [1_000.0]
+    runs = []
+    monkeypatch.setattr(download.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(TwitchVODDownloader, "_resolve_yt_dlp_path", staticmethod(lambda: "yt-dlp"))
+    monkeypatch.setattr(TwitchVODDownloader, "_probe_yt_dlp", staticmethod(lambda path: runs.append(path) or True))
+
+    assert downloader.check_yt_dlp() is True
+    assert downloader.check_yt_dlp() is True
+    assert len(runs) == 1
+
+    clock[0] += download.YT_DLP_CHECK_TTL_SECONDS + 1
+    assert downloader.check_yt_dlp() is True
+    assert len(runs) == 2
+
+
+def test_iter_progress_updates_pushes_changes_until_terminal(tmp_path) -> None:
+    downloader = TwitchVODDownloader(output_dir=str(tmp_path))
+    downloader.jobs["job-1"] = {"status": "downloading", "percentage": 0}
+    updates = iter_progress_updates(downloader, "job-1", keepalive_seconds=0.05)
+
+    assert next(updates)["percentage"] == 0
+    assert next(updates) is None
+
+    def finish() -> None:
+        time.sleep(0.02)
+        downloader._update_job("job-1", percentage=50)
+        time.sleep(0.02)
+        downloader._update_job("job-1", status="completed", percentage=100)
+
+    worker = threading.Thread(target=finish)
+    worker.start()
+    remaining = [update for update in updates if update is not None]
+    worker.join()
+
+    assert remaining[-1]["status"] == "completed"
+    assert remaining[-1]["percentage"] == 100
+
+
+def test_finished_jobs_expire_after_ttl(tmp_path, monkeypatch) -> None:
+    clock = [500.0]
+    monkeypatch.setattr(download.time, "monotonic", lambda: clock[0])
+    downloader = TwitchVODDownloader(output_dir=str(tmp_path), finished_job_ttl_seconds=60)
+    downloader.jobs["done"] = {"status": "downloading"}
+    downloader.jobs["active"] = {"status": "downloading"}
+    downloader._update_job("done", status="completed")
+
+    clock[0] += 30
+    assert downloader.get_progress("done") is not None
+
+    downloader._update_job("active", status="error")
+
+    clock[0] += 31
+    assert downloader.get_progress("done") is None
+    assert [job_id for job_id, _ in downloader.list_jobs()] == ["active"]
+
+    clock[0] += 30
+    assert downloader.get_progress("active") is None
+
+
+def test_jobs_eviction_drops_oldest_finished_jobs_only(tmp_path, monkeypatch) -> None:
+    downloader = TwitchVODDownloader(output_dir=str(tmp_path), max_jobs=2)
+    monkeypatch.setattr(downloader, "_download_worker", lambda *args: None)
+
+    downloader.start_download("https://www.twitch.tv/videos/1", "active")
+    downloader.start_download("https://www.twitch.tv/videos/2", "done-old")
+    downloader._update_job("done-old", status="completed")
+    downloader.start_download("https://www.twitch.tv/videos/3", "done-new")
+    downloader._update_job("done-new", status="error")
+
+    assert list(downloader.jobs) == ["active", "done-new"]
+
+    downloader.start_download("https://www.twitch.tv/videos/4", "active-2")
+    downloader.start_download("https://www.twitch.tv/videos/5", "active-3")
+    # Only unfinished jobs remain, so the cap is exceeded rather than dropping live work.
+    assert list(downloader.jobs) == ["active", "active-2", "active-3"]
+
+
+def test_vod_downloader_jobs_share_an_immutable_view_per_downloader(tmp_path) -> None:
+    downloader = TwitchVODDownloader(output_dir=str(tmp_path))
+    other = TwitchVODDownloader(output_dir=str(tmp_path))
+    downloader.jobs["job-1"] = {"url": "https://www.twitch.tv/videos/1", "status": "downloading", "percentage": 5}
+
+    first = vod_download_jobs.vod_downloader_as_twitch_jobs(downloader)
+    assert isinstance(first, tuple)
+    assert vod_download_jobs.vod_downloader_as_twitch_jobs(downloader) is first
+    assert vod_download_jobs.vod_downloader_as_twitch_jobs(other) == ()
+    assert not hasattr(downloader, "twitch_jobs_view")
+
+    # The memo does not keep a discarded downloader alive.
+    ref = weakref.ref(downloader)
+    del downloader
+    gc.collect()
+    assert ref() is None
+    assert first[0]["id"] == "job-1"
+
+
+def test_wait_for_job_change_ignores_other_jobs(tmp_path) -> None:
+    downloader = TwitchVODDownloader(output_dir=str(tmp_path))
+    downloader.jobs["job-a"] = {"status": "downloading"}
+    downloader.jobs["job-b"] = {"status": "downloading"}
+    downloader._update_job("job-a", percentage=1)
+    revision, _ = downloader.wait_for_job_change("job-a", -1, 0)
+
+    downloader._update_job("job-b", percentage=50)
+    assert downloader.wait_for_job_change("job-a", revision, 0)[0] == revision
+
+    result = {}
+    waiter = threading.Thread(
+        target=lambda: result.update(change=downloader.wait_for_job_change("job-a", revision, 5)),
+    )
+    waiter.start()
+    downloader._update_job("job-a", percentage=2)
+    waiter.join(5)
+
+    new_revision, job = result["change"]
+    assert new_revision != revision
+    assert job["percentage"] == 2
+
+
+def test_worker_callback_survives_job_evicted_after_update(tmp_path, monkeypatch) -> None:
+    downloader = TwitchVODDownloader(output_dir=str(tmp_path), max_jobs=1)
+    monkeypatch.setattr(downloader, "_run_download_slot", lambda *args: None)
+    monkeypatch.setattr(downloader, "check_yt_dlp", lambda: False)
+    downloader.start_download("https://www.twitch.tv/videos/1", "job-1")
+    real_update = downloader._update_job
+
+    def update_then_evict(job_id, **fields):
+        snapshot = real_update(job_id, **fields)
+        # A newer job arrives between the update and the callback and evicts the finished one.
+        downloader.start_download("https://www.twitch.tv/videos/2", "job-2")
+        return snapshot
+
+    monkeypatch.setattr(downloader, "_update_job", update_then_evict)
+    received = []
+
+    downloader._download_worker("job-1", "https://www.twitch.tv/videos/1", received.append)
+
+    assert "job-1" not in downloader.jobs
+    assert [job["status"] for job in received] == ["error"]
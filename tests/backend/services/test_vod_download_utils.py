@@ -11,6 +11,15 @@ def test_validate_twitch_vod_url() -> None:
     assert not validate_twitch_vod_url("https://www.youtube.com/watch?v=123")
 
 
+def test_validate_twitch_vod_url_is_anchored() -> None:
+    assert validate_twitch_vod_url("https://www.twitch.tv/videos/123456/")
+    assert validate_twitch_vod_url("https://www.twitch.tv/videos/123456?t=1h2m3s")
+    assert not validate_twitch_vod_url("https://www.twitch.tv/videos/123456abc")
+    assert not validate_twitch_vod_url("https://www.twitch.tv/videos/123456/extra")
+    assert not validate_twitch_vod_url("https://www.twitch.tv/videos/123456 --exec calc")
+    assert not validate_twitch_vod_url("https://www.twitch.tv/videos/123456\n")
+
+
 def test_parse_progress_template() -> None:
     parsed = parse_progress_template(" 84.7%| 30.37MiB/s|00:01")
     assert parsed is not None
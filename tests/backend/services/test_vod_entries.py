@@ -0,0 +1,23 @@
+import os
+from pathlib import Path
+
+from app.vod import entries
+
+
+def test_build_vod_entries_lists_every_session(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(entries, "get_media_duration", lambda _path: 100.0)
+    vod = tmp_path / "My VOD.mp4"
+    vod.write_bytes(b"vod")
+    bookmarks_dir = tmp_path / "bookmarks"
+    bookmarks_dir.mkdir()
+    for index, name in enumerate(("session_My_VOD_20240101_120000.csv", "session_My_VOD_20240102_120000.csv")):
+        session = bookmarks_dir / name
+        session.write_text("", encoding="utf-8")
+        os.utime(session, (1_000 + index, 1_000 + index))
+
+    [entry] = entries.build_vod_entries([vod], bookmarks_dir, "session")
+
+    assert [session["name"] for session in entry["sessions"]] == [
+        "session_My_VOD_20240102_120000.csv",
+        "session_My_VOD_20240101_120000.csv",
+    ]
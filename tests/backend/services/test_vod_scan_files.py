@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from app.vod import scan_files
+
+
+def test_delete_vod_session_artifacts_removes_only_matching_files(tmp_path: Path) -> None:
+    doomed = [
+        tmp_path / "session_My_VOD_20240101.csv",
+        tmp_path / "session_My_VOD_20240101.jsonl",
+        tmp_path / "session_My_VOD.scanning",
+        tmp_path / "session_My_VOD.paused",
+    ]
+    kept = [
+        tmp_path / "session_My_VOD_notes.txt",
+        tmp_path / "session_My_VOD_2_20240101.csv.bak",
+        tmp_path / "session_Other_20240101.csv",
+    ]
+    for path in doomed + kept:
+        path.write_text("x", encoding="utf-8")
+
+    removed = scan_files.delete_vod_session_artifacts(tmp_path, "session", "C:/vods/My VOD.mp4")
+
+    assert removed == len(doomed)
+    assert not any(path.exists() for path in doomed)
+    assert all(path.exists() for path in kept)
+
+
+def test_delete_vod_session_artifacts_tolerates_missing_directory(tmp_path: Path) -> None:
+    assert scan_files.delete_vod_session_artifacts(tmp_path / "missing", "session", "vod") == 0
@@ -148,3 +148,68 @@ def test_choose_directory_windows_nonzero_return(monkeypatch) -> None:
 
     monkeypatch.setattr(shell.subprocess, "run", lambda *_args, **_kwargs: Result())
     assert shell.choose_directory("C:/") == ""
+
+
+def test_snapshot_mtimes_skips_ignored_and_cache_dirs(tmp_path: Path) -> None:
+    kept = tmp_path / "pkg" / "mod.py"
+    kept.parent.mkdir()
+    kept.write_text("a=1", encoding="utf-8")
+    (tmp_path / "pkg" / "notes.txt").write_text("x", encoding="utf-8")
+    cache_dir = tmp_path / "pkg" / "__pycache__"
+    cache_dir.mkdir()
+    (cache_dir / "stale.py").write_text("a=1", encoding="utf-8")
+    ignored_dir = tmp_path / "uploads"
+    ignored_dir.mkdir()
+    (ignored_dir / "upload.js").write_text("x", encoding="utf-8")
+    log_file = tmp_path / "app.js"
+    log_file.write_text("x", encoding="utf-8")
+
+    ignore_paths = {ignored_dir, log_file}
+    is_watched = shell._make_watch_filter(shell.DEFAULT_WATCH_SUFFIXES, ignore_paths)
+    snapshot = shell._snapshot_mtimes([tmp_path], is_watched, ignore_paths)
+
+    assert list(snapshot) == [kept]
+
+
+def test_watch_filter_ignores_dirs_created_after_startup(tmp_path: Path) -> None:
+    late_dir = tmp_path / "uploads"
+    is_watched = shell._make_watch_filter(shell.DEFAULT_WATCH_SUFFIXES, {late_dir})
+
+    late_dir.mkdir()
+    assert not is_watched(late_dir / "upload.js")
+    assert is_watched(tmp_path / "main.py")
+
+
+def test_change_observer_reacts_only_to_content_events(tmp_path: Path, monkeypatch) -> None:
+    handlers = []
+
+    class FakeObserver:
+        daemon = False
+
+        def schedule(self, handler, path, recursive):
+            handlers.append(handler)
+
+        def start(self):
+            pass
+
+    class Event:
+        is_directory = False
+
+        def __init__(self, event_type: str) -> None:
+            self.event_type = event_type
+            self.src_path = str(tmp_path / "main.py")
+
+    monkeypatch.setattr(shell, "Observer", FakeObserver)
+    changes = []
+    observer = shell._start_change_observer(
+        [tmp_path],
+        shell._make_watch_filter(shell.DEFAULT_WATCH_SUFFIXES, set()),
+        lambda: changes.append(True),
+    )
+
+    assert observer is not None
+    handlers[0].on_any_event(Event("opened"))
+    handlers[0].on_any_event(Event("closed"))
+    assert changes == []
+    handlers[0].on_any_event(Event("modified"))
+    assert changes == [True]
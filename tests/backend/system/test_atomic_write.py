@@ -0,0 +1,48 @@
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from app.system import atomic_write
+
+
+def test_write_text_atomic_replaces_file_without_leftovers(tmp_path: Path) -> None:
+    target = tmp_path / "config.json"
+    target.write_text("old", encoding="utf-8")
+
+    atomic_write.write_text_atomic(target, '{"new": true}', fsync=True)
+
+    assert target.read_text(encoding="utf-8") == '{"new": true}'
+    assert [path.name for path in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_write_text_atomic_keeps_original_when_replace_fails(tmp_path: Path, monkeypatch) -> None:
+    target = tmp_path / "config.json"
+    target.write_text("old", encoding="utf-8")
+
+    def failing_replace(_src, _dst):
+        raise PermissionError("locked")
+
+    monkeypatch.setattr(atomic_write.os, "replace", failing_replace)
+    monkeypatch.setattr(atomic_write, "REPLACE_RETRY_DELAY_SECONDS", 0)
+
+    with pytest.raises(PermissionError):
+        atomic_write.write_text_atomic(target, "new")
+
+    assert target.read_text(encoding="utf-8") == "old"
+    assert [path.name for path in tmp_path.iterdir()] == ["config.json"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_write_text_atomic_preserves_existing_mode(tmp_path: Path) -> None:
+    target = tmp_path / "job.json"
+    target.write_text("old", encoding="utf-8")
+    target.chmod(0o644)
+
+    atomic_write.write_text_atomic(target, "new")
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+    created = tmp_path / "new.json"
+    atomic_write.write_text_atomic(created, "new")
+    assert stat.S_IMODE(created.stat().st_mode) == 0o666 & ~atomic_write._UMASK
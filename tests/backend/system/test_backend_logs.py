@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from app.system import backend_logs
+
+
+def test_tail_lines_missing_file(tmp_path: Path) -> None:
+    assert backend_logs.tail_lines(tmp_path / "missing.log") == []
+
+
+def test_tail_lines_reads_across_chunk_boundaries(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(backend_logs, "TAIL_CHUNK_SIZE", 16)
+    backend_logs._read_tail_lines.cache_clear()
+    log_path = tmp_path / "app.log"
+    lines = [f"line {index:03d} message" for index in range(50)]
+    log_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    assert backend_logs.tail_lines(log_path, max_lines=5) == lines[-5:]
+    assert backend_logs.tail_lines(log_path, max_lines=500) == lines
+
+
+def test_tail_lines_sees_appended_lines(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("first\n", encoding="utf-8")
+    assert backend_logs.tail_lines(log_path, max_lines=10) == ["first"]
+
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write("second\n")
+
+    assert backend_logs.tail_lines(log_path, max_lines=10) == ["first", "second"]
+
+
+def test_open_backend_log_detaches_editor_on_posix(tmp_path: Path, monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr(backend_logs.sys, "platform", "linux")
+    monkeypatch.setattr(backend_logs.subprocess, "Popen", lambda cmd, **kwargs: calls.append((cmd, kwargs)))
+
+    backend_logs.open_backend_log(tmp_path / "app.log")
+
+    assert calls[0][0] == ["xdg-open", str(tmp_path / "app.log")]
+    assert calls[0][1]["start_new_session"] is True
+    assert calls[0][1]["close_fds"] is True
@@ -0,0 +1,19 @@
+import pytest
+
+from app.system.http_cache import is_hashed_asset_path
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["assets/index-BxK3a9_Q.js", "assets/vendor-react-0a1B2c3D.css", "assets/logo-AbCdEf12.png"],
+)
+def test_is_hashed_asset_path_accepts_vite_bundles(path: str) -> None:
+    assert is_hashed_asset_path(path)
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["index.html", "logo.png", "assets/index.js", "assets/nested/app-BxK3a9_Q.js", "other/app-BxK3a9_Q.js"],
+)
+def test_is_hashed_asset_path_rejects_unhashed_files(path: str) -> None:
+    assert not is_hashed_asset_path(path)
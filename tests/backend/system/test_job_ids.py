@@ -0,0 +1,39 @@
+import time
+import uuid
+
+from app.system import job_ids
+
+
+def test_new_job_uuid_prefers_native_uuid7(monkeypatch) -> None:
+    sentinel = uuid.UUID(int=7)
+    monkeypatch.setattr(job_ids, "_native_uuid7", lambda: sentinel)
+    assert job_ids.new_job_uuid() is sentinel
+
+
+def test_uuid7_sets_version_variant_and_timestamp() -> None:
+    before_ms = time.time_ns() // 1_000_000
+    value = job_ids._uuid7()
+    after_ms = time.time_ns() // 1_000_000
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert before_ms <= value.int >> 80 <= after_ms + 1
+
+
+def test_uuid7_is_monotonic_within_a_millisecond(monkeypatch) -> None:
+    monkeypatch.setattr(job_ids.time, "time_ns", lambda: 1_700_000_000_000 * 1_000_000)
+    monkeypatch.setattr(job_ids, "_last_ms", 0)
+
+    values = [job_ids._uuid7() for _ in range(5000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert all(value.version == 7 for value in values)
+
+
+def test_new_job_uuid_falls_back_to_uuid7_generator(monkeypatch) -> None:
+    monkeypatch.setattr(job_ids, "_native_uuid7", None)
+    first = job_ids.new_job_uuid()
+    second = job_ids.new_job_uuid()
+    assert first.version == 7
+    assert first < second
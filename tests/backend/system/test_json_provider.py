@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+from app.system import json_provider
+
+
+def _make_app() -> Flask:
+    app = Flask(__name__)
+    app.json = json_provider.OrjsonProvider(app)
+    return app
+
+
+def test_orjson_provider_matches_default_provider_output() -> None:
+    app = _make_app()
+    payload = {"b": 1, "a": [1.5, None, "é"], 3: True, "when": datetime(2024, 1, 2, tzinfo=timezone.utc)}
+
+    encoded = app.json.dumps(payload)
+
+    assert app.json.loads(encoded) == {
+        "a": [1.5, None, "é"],
+        "b": 1,
+        "3": True,
+        "when": "Tue, 02 Jan 2024 00:00:00 GMT",
+    }
+
+
+def test_orjson_provider_honors_indent() -> None:
+    app = _make_app()
+    assert app.json.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def test_orjson_provider_falls_back_without_orjson(monkeypatch) -> None:
+    monkeypatch.setattr(json_provider, "orjson", None)
+    app = _make_app()
+    with app.app_context():
+        response = app.json.response({"ok": True})
+    assert response.get_json() == {"ok": True}
+
+
+def test_orjson_provider_uses_orjson_when_installed() -> None:
+    orjson = pytest.importorskip("orjson")
+    app = _make_app()
+    assert app.json.loads(app.json.dumps({"big": 2 ** 70})) == {"big": 2 ** 70}
+    assert app.json.dumps({"a": 1}) == orjson.dumps({"a": 1}).decode("utf-8")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_indented_helpers_round_trip(monkeypatch, use_orjson) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(json_provider, "orjson", None)
+    payload = {"id": "job", "progress": 12.5, "title": "Café"}
+
+    text = json_provider.dumps_indented(payload)
+
+    assert text.startswith("{\n  ")
+    assert json_provider.loads_json(text.encode("utf-8")) == payload
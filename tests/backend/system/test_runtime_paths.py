@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from app import runtime_paths
+
+
+def test_resolve_tool_reuses_cached_path_until_it_disappears(tmp_path: Path, monkeypatch) -> None:
+    tool = tmp_path / "ffmpeg"
+    tool.write_bytes(b"")
+    lookups = []
+
+    def fake_which(name: str):
+        lookups.append(name)
+        return str(tool) if tool.exists() else None
+
+    monkeypatch.setattr(runtime_paths, "_resolved_tools", {})
+    monkeypatch.setattr(runtime_paths.shutil, "which", fake_which)
+    monkeypatch.setattr(runtime_paths, "get_tools_dirs", lambda: [])
+
+    assert runtime_paths.resolve_tool("ffmpeg") == str(tool)
+    assert runtime_paths.resolve_tool("ffmpeg") == str(tool)
+    assert lookups == ["ffmpeg"]
+
+    tool.unlink()
+    assert runtime_paths.resolve_tool("ffmpeg") is None
+    assert lookups == ["ffmpeg", "ffmpeg"]
@@ -0,0 +1,59 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from app.system.static_index import StaticFileIndex
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_static_index_lists_nested_files(tmp_path: Path) -> None:
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<html>", encoding="utf-8")
+    (tmp_path / "assets" / "app-abc123.js").write_text("js", encoding="utf-8")
+
+    index = StaticFileIndex(tmp_path, revalidate_seconds=0)
+
+    assert index.root_exists() is True
+    assert index.contains("index.html")
+    assert index.contains("assets/app-abc123.js")
+    assert not index.contains("assets")
+    assert not index.contains("../index.html")
+    assert not index.contains("")
+
+
+def test_static_index_refreshes_when_a_directory_changes(tmp_path: Path) -> None:
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    index = StaticFileIndex(tmp_path, revalidate_seconds=0)
+    assert not index.contains("assets/new.js")
+
+    (assets / "new.js").write_text("js", encoding="utf-8")
+    _bump_mtime(assets)
+
+    assert index.contains("assets/new.js")
+
+
+def test_static_index_reports_missing_root(tmp_path: Path) -> None:
+    index = StaticFileIndex(tmp_path / "dist", revalidate_seconds=0)
+    assert index.root_exists() is False
+    assert not index.contains("index.html")
+
+
+def test_static_index_survives_symlink_loops(tmp_path: Path) -> None:
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "app.js").write_text("js", encoding="utf-8")
+    try:
+        (assets / "loop").symlink_to(tmp_path, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not permitted here")
+
+    index = StaticFileIndex(tmp_path, revalidate_seconds=0)
+
+    assert index.contains("assets/app.js")
+    assert not index.contains("assets/loop/assets/app.js")